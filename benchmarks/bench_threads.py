@@ -0,0 +1,86 @@
+"""Benchmark of the scan of a directory by amount of threads
+
+Run it with the GIL and without it (free-threaded builds of CPython, ex. 3.13t) to
+compare the speed-up by core count:
+
+    python -m benchmarks.bench_threads --files 2000
+    python3.13t -X gil=0 -m benchmarks.bench_threads --files 2000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import List
+
+from py_imports.manager import PyImports
+
+
+MODULE_TEMPLATE = '''"""Synthetic module {index}"""
+import os
+import sys
+from typing import TYPE_CHECKING, Dict, List
+
+from .module_{previous} import function_{previous}
+
+if TYPE_CHECKING:
+    from collections import OrderedDict
+
+
+def function_{index}(values: List[int]) -> Dict[str, int]:
+    import json
+
+    result = {{str(value): value * 2 for value in values}}
+    return json.loads(json.dumps(result))
+
+
+class Class{index}:
+    def method(self) -> str:
+        return os.path.join(sys.prefix, str(function_{previous}))
+'''
+
+
+def create_corpus(directory: str, files: int) -> None:
+    """Create a package with synthetic modules"""
+    for index in range(files):
+        path = os.path.join(directory, f"module_{index}.py")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(MODULE_TEMPLATE.format(index=index, previous=max(index - 1, 0)))
+
+
+def scan(directory: str, workers: int) -> float:
+    """Get the seconds to scan the directory"""
+    start = time.perf_counter()
+    with PyImports() as manager:  # type: ignore
+        manager.get_imports(directory, workers=workers)
+    return time.perf_counter() - start
+
+
+def main(arguments: List[str]) -> None:
+    """Print the time and speed-up of the scan by amount of threads"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    options = parser.parse_args(arguments)
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    gil = "enabled" if is_gil_enabled else "disabled"
+    print(f"python {sys.version.split()[0]}, GIL {gil}")
+    print(f"{options.files} files, best of {options.repeat}")
+
+    workers_options = [1]
+    while workers_options[-1] * 2 <= options.max_workers:
+        workers_options.append(workers_options[-1] * 2)
+
+    with tempfile.TemporaryDirectory() as directory:
+        create_corpus(directory, options.files)
+        baseline = 0.0
+        for workers in workers_options:
+            seconds = min(scan(directory, workers) for _ in range(options.repeat))
+            baseline = baseline or seconds
+            print(f"{workers:>3} threads: {seconds:7.3f}s  x{baseline / seconds:.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,9 +1,18 @@
 """ast classes to parse py files"""
 import ast
-from typing import Any, List
+import io
+import logging
+import textwrap
+import tokenize
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Type, Union
 
 from py_imports.base import ImportsCollectionFile
+from py_imports.base.models import RuntimeRelevance
 from py_imports.mixins import UnUsedImportMixin
+from py_imports.plugins import AnalyzerPlugin, Handler
+
+
+logger = logging.getLogger(__name__)
 
 
 class AstImportAnalyzer(UnUsedImportMixin, ast.NodeVisitor):
@@ -11,21 +20,76 @@ class AstImportAnalyzer(UnUsedImportMixin, ast.NodeVisitor):
     Capture the import statements in a py module file
     """
 
+    # Priority of each runtime relevance, the highest found around the import wins
+    RELEVANCE_PRIORITY = {
+        "always": 0,
+        "conditional": 1,
+        "optional": 2,
+        "deferred": 3,
+        "type_checking": 4,
+    }
+
+    # Exceptions that catch a failed import
+    IMPORT_ERRORS = {"ImportError", "ModuleNotFoundError", "Exception", "BaseException"}
+
+    # Nodes which body is not executed when the module is imported
+    DEFERRED_NODES: Tuple[Type[ast.AST], ...] = (
+        ast.FunctionDef,
+        ast.AsyncFunctionDef,
+        ast.Lambda,
+    )
+
+    # Nodes of try statements, "try ... except*" was included in python 3.11
+    TRY_NODES: Tuple[Type[Any], ...] = (
+        ast.Try,
+        *[getattr(ast, name) for name in ("TryStar",) if hasattr(ast, name)],
+    )
+
+    # Nodes which body could be executed or not, or several times
+    CONDITIONAL_NODES: Tuple[Type[ast.AST], ...] = (
+        ast.If,
+        ast.For,
+        ast.AsyncFor,
+        ast.While,
+        *[getattr(ast, name) for name in ("match_case",) if hasattr(ast, name)],
+    )
+
     # will be disable invalid-name alert in this class, because the builtin ast, does not
     # follow the snake_case format in his methods name
     # pylint: disable=C0103
-    def __init__(self, file_content: List[str], raw_content: str) -> None:
+    def __init__(
+        self,
+        file_content: List[str],
+        raw_content: str,
+        plugins: Sequence[AnalyzerPlugin] = (),
+        tree: Optional[ast.AST] = None,
+    ) -> None:
+        """
+        Args:
+            file_content: lines of the source code
+            raw_content: source code
+            plugins: plugins run in the same traversal, see AnalyzerPlugin
+            tree: ast of the source code, if it was already parsed
+        """
         self.file_content = file_content
         self.raw_content = raw_content
         super().__init__()
         self._imports_collector = ImportsCollectionFile()
-        self._unused_imports = self.get_unused_import()
+        self._unused_imports = self.get_unused_import(tree)
+        self._plugins = plugins
+        self._plugin_handlers: Dict[Type[ast.AST], List[Handler]] = {}
+        for plugin in plugins:
+            for node_type, handler in plugin.handlers().items():
+                self._plugin_handlers.setdefault(node_type, []).append(handler)
 
     def visit(self, node: Any) -> Any:
         """Visit a node."""
         method = "visit_" + node.__class__.__name__
         visitor = getattr(self, method, self.generic_visit)
 
+        for handler in self._plugin_handlers.get(node.__class__, ()):
+            handler(node)
+
         # Set a parent in child to every node traversed
         for child in ast.iter_child_nodes(node):
             parent: ast.AST = node
@@ -33,6 +97,69 @@ class AstImportAnalyzer(UnUsedImportMixin, ast.NodeVisitor):
 
         return visitor(node)
 
+    @staticmethod
+    def is_type_checking_test(node: ast.AST) -> bool:
+        """Validate if the condition is TYPE_CHECKING or typing.TYPE_CHECKING"""
+        if isinstance(node, ast.Name):
+            return node.id == "TYPE_CHECKING"
+        if isinstance(node, ast.Attribute):
+            return node.attr == "TYPE_CHECKING"
+        return False
+
+    def catches_import_error(self, node: Any) -> bool:
+        """Validate if some handler of the try statement catches a failed import"""
+        for handler in node.handlers:
+            if handler.type is None:
+                return True
+            types = (
+                handler.type.elts
+                if isinstance(handler.type, ast.Tuple)
+                else [handler.type]
+            )
+            names = {
+                exception.id if isinstance(exception, ast.Name) else exception.attr
+                for exception in types
+                if isinstance(exception, (ast.Name, ast.Attribute))
+            }
+            if names & self.IMPORT_ERRORS:
+                return True
+        return False
+
+    def get_runtime_relevance(self, node: ast.AST) -> RuntimeRelevance:
+        """Get when the import is executed according to the structures around it
+
+        Notes:
+            The parents of the import are traversed up to the module, the relevance
+            with the highest priority found wins, ex. an import inside a function
+            defined under "if TYPE_CHECKING:" is never executed at runtime
+        """
+        relevance: RuntimeRelevance = "always"
+        child: Any = node
+        parent: Any = getattr(node, "parent", None)
+        while parent is not None and not isinstance(parent, ast.Module):
+            found: RuntimeRelevance = "always"
+            if isinstance(parent, ast.If) and self.is_type_checking_test(parent.test):
+                found = "type_checking" if child in parent.body else "conditional"
+            elif isinstance(parent, self.DEFERRED_NODES):
+                found = "deferred"
+            elif isinstance(parent, self.CONDITIONAL_NODES):
+                found = "conditional"
+            elif isinstance(parent, self.TRY_NODES) and child in parent.orelse:
+                found = "conditional"
+            elif isinstance(parent, self.TRY_NODES) and child in parent.body:
+                found = "optional" if self.catches_import_error(parent) else "always"
+            elif isinstance(parent, ast.ExceptHandler):
+                try_node = getattr(parent, "parent", None)
+                is_fallback = isinstance(
+                    try_node, self.TRY_NODES
+                ) and self.catches_import_error(try_node)
+                found = "optional" if is_fallback else "conditional"
+
+            if self.RELEVANCE_PRIORITY[found] > self.RELEVANCE_PRIORITY[relevance]:
+                relevance = found
+            child, parent = parent, getattr(parent, "parent", None)
+        return relevance
+
     def visit_Import(self, node: ast.Import) -> Any:
         """
         Capture the import statements that not used "from" keyword
@@ -53,6 +180,7 @@ class AstImportAnalyzer(UnUsedImportMixin, ast.NodeVisitor):
             statement=self.file_content[node.lineno - 1],
             children_unused=self._unused_imports.get(node.lineno, []),
             outer_parent_node=parent_node if is_in_inner_scope else None,
+            runtime_relevance=self.get_runtime_relevance(node),
         )
         self.generic_visit(node)
 
@@ -84,10 +212,121 @@ class AstImportAnalyzer(UnUsedImportMixin, ast.NodeVisitor):
             statement=self.file_content[node.lineno - 1],
             children_unused=self._unused_imports.get(node.lineno, []),
             outer_parent_node=parent_node if is_in_inner_scope else None,
+            runtime_relevance=self.get_runtime_relevance(node),
         )
         self.generic_visit(node)
 
     @property
     def imports_metadata(self) -> ImportsCollectionFile:
         """Get the import invoked with just statement import"""
+        for plugin in self._plugins:
+            self._imports_collector.plugins_data[plugin.name] = plugin.result()
+        return self._imports_collector
+
+
+class TokenImportAnalyzer:
+    """
+    Recover the import statements in a py module file that can not be parsed
+
+    The source is traversed with the tokenizer, every statement that begins with
+    "import" or "from" is parsed in isolation, so a syntax error in another part
+    of the file does not hide the imports around it.
+    """
+
+    # Max amount of lines that a single import statement is expected to take
+    MAX_STATEMENT_LINES = 50
+
+    # Tokens after which a new logical line can begin
+    LINE_BOUNDARIES = {
+        tokenize.NEWLINE,
+        tokenize.NL,
+        tokenize.INDENT,
+        tokenize.DEDENT,
+        tokenize.ENCODING,
+    }
+
+    def __init__(self, file_content: List[str], raw_content: str) -> None:
+        self.file_content = file_content
+        self.raw_content = raw_content.replace("\0", "")
+        self._lines = io.StringIO(self.raw_content, newline=None).readlines()
+        self._imports_collector = ImportsCollectionFile()
+
+    def _candidate_lines(self) -> Iterator[int]:
+        """Get the lines where a import statement begins"""
+        previous_type: Optional[int] = None
+        previous_line = 0
+        readline = io.StringIO(self.raw_content).readline
+        try:
+            for token in tokenize.generate_tokens(readline):
+                if token.type == tokenize.COMMENT:
+                    continue
+                is_line_start = (
+                    previous_type is None or previous_type in self.LINE_BOUNDARIES
+                )
+                line = token.line
+                is_first_token = token.start[1] == len(line) - len(line.lstrip())
+                if (
+                    token.type == tokenize.NAME
+                    and token.string in ("import", "from")
+                    and is_line_start
+                    and is_first_token
+                ):
+                    yield token.start[0]
+                previous_type = token.type
+                previous_line = token.start[0]
+        except (tokenize.TokenError, SyntaxError):
+            # The tokens yielded until the error are all that can be recovered
+            logger.debug("Tokenizer stopped at line %s", previous_line)
+
+    def _parse_statement(self, line: int) -> Optional[Union[ast.Import, ast.ImportFrom]]:
+        """Parse the shortest snippet that begins in the line as a import statement"""
+        snippet = ""
+        last_line = line - 1 + self.MAX_STATEMENT_LINES
+        for line_content in self._lines[line - 1 : last_line]:  # noqa: E203
+            snippet += line_content
+            try:
+                tree = ast.parse(textwrap.dedent(snippet))
+            except (SyntaxError, ValueError):
+                continue
+
+            node = tree.body[0] if tree.body else None
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                return node
+            return None
+        return None
+
+    def analyze(self) -> None:
+        """Recover the import statements in the source"""
+        for line in self._candidate_lines():
+            node = self._parse_statement(line)
+            if node is None:
+                continue
+
+            statement = self.file_content[line - 1]
+            in_inner_scope = bool(statement) and statement[0].isspace()
+            # Without the structure around the import, the indentation is all we know
+            runtime_relevance = "conditional" if in_inner_scope else "always"
+            children = [alias.name for alias in node.names]
+            if isinstance(node, ast.ImportFrom):
+                self._imports_collector.register_import_from(
+                    line=line,
+                    children=children,
+                    parent=node.module if node.module else "",
+                    level=node.level,
+                    statement=statement,
+                    in_inner_scope=in_inner_scope,
+                    runtime_relevance=runtime_relevance,
+                )
+            else:
+                self._imports_collector.register_import(
+                    line=line,
+                    children=children,
+                    statement=statement,
+                    in_inner_scope=in_inner_scope,
+                    runtime_relevance=runtime_relevance,
+                )
+
+    @property
+    def imports_metadata(self) -> ImportsCollectionFile:
+        """Get the import recovered from the source"""
         return self._imports_collector
@@ -1,7 +1,8 @@
 """Base schemas"""
-from .models import ImportsCollectionFile
+from .models import ImportsCollectionFile, ScanError
 
 
 __all__ = [
     "ImportsCollectionFile",
+    "ScanError",
 ]
@@ -1,5 +1,18 @@
 """Base classes to define Imports behaviors"""
-from typing import Any, List, Union
+from typing import Any, Dict, List, Optional, Union
+
+from typing_extensions import Literal
+
+
+# When the import is executed, in relation with the import of the module that has it
+#   always: at import time, unconditionally
+#   conditional: at import time, depending on a condition or loop
+#   optional: at import time, but it's guarded by an "except ImportError" (fallbacks)
+#   deferred: when the function that has it is called, not at import time
+#   type_checking: never at runtime, just by the type checkers (if TYPE_CHECKING:)
+RuntimeRelevance = Literal[
+    "always", "conditional", "optional", "deferred", "type_checking"
+]
 
 
 class ImportStatement:
@@ -27,10 +40,34 @@ class ImportStatement:
         self.from_internal: bool = False
         self.children_unused: List = kwargs.pop("children_unused", [])
         self.outer_parent_node: Any = kwargs.pop("outer_parent_node", None)
-        self.in_inner_scope: bool = bool(self.outer_parent_node)
+        self.in_inner_scope: bool = kwargs.pop(
+            "in_inner_scope", bool(self.outer_parent_node)
+        )
+        self.runtime_relevance: RuntimeRelevance = kwargs.pop(
+            "runtime_relevance", "always"
+        )
 
         self.kwargs = kwargs
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Get a JSON serializable representation of the import
+
+        Notes:
+            The outer_parent_node is not included, just if the import is located
+            in an inner scope
+        """
+        data = {
+            "line": self.line,
+            "children": self.children,
+            "statement": self.statement,
+            "children_unused": self.children_unused,
+            "in_inner_scope": self.in_inner_scope,
+            "runtime_relevance": self.runtime_relevance,
+        }
+        if isinstance(self, ImportFromStatement):
+            data.update({"parent": self.parent, "level": self.level})
+        return data
+
 
 class ImportFromStatement(ImportStatement):
     """
@@ -120,6 +157,58 @@ class AbsoluteImportStatement(ImportFromStatement):
         super().__init__(line, children, parent, statement, **kwargs)
 
 
+class ScanError:
+    """
+    Class that represent an error found while a file was scanned
+    """
+
+    def __init__(
+        self,
+        path: str,
+        error_type: str,
+        message: str,
+        line: Optional[int] = None,
+        recovered: bool = False,
+    ) -> None:
+        """Initialize scan error
+        Args:
+            path: Path or name of the source where the error was found
+            error_type: Name of the exception raised, ex. SyntaxError
+            message: Description of the error
+            line: Line where the error was found in the file, if it's known
+            recovered: If the imports were partially recovered despite the error
+        """
+        self.path = path
+        self.error_type = error_type
+        self.message = message
+        self.line = line
+        self.recovered = recovered
+
+    @classmethod
+    def from_exception(
+        cls, path: str, error: BaseException, recovered: bool = False
+    ) -> "ScanError":
+        """Build the scan error from the exception raised"""
+        message = getattr(error, "msg", None) or str(error)
+        line = getattr(error, "lineno", None)
+        return cls(path, type(error).__name__, message, line, recovered)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get a JSON serializable representation of the error"""
+        return {
+            "path": self.path,
+            "error_type": self.error_type,
+            "message": self.message,
+            "line": self.line,
+            "recovered": self.recovered,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ScanError":
+        """Build the error from the representation given by to_dict"""
+        return cls(**data)
+
+
 class ImportsCollectionFile:
     """
     Class to collect the meta information about the imports in a file
@@ -129,6 +218,8 @@ class ImportsCollectionFile:
         self.imports: List = []
         self.relative_imports: List = []
         self.absolute_imports: List = []
+        # Results of the analyzer plugins by plugin name
+        self.plugins_data: Dict[str, Any] = {}
 
     def register_import_from(
         self,
@@ -170,3 +261,30 @@ class ImportsCollectionFile:
         simple_import = ImportStatement(line, children, statement, **kwargs)
         self.imports.append(simple_import)
         return simple_import
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get a JSON serializable representation of the imports in the file"""
+        return {
+            "imports": [statement.to_dict() for statement in self.imports],
+            "relative_imports": [
+                statement.to_dict() for statement in self.relative_imports
+            ],
+            "absolute_imports": [
+                statement.to_dict() for statement in self.absolute_imports
+            ],
+            "plugins_data": self.plugins_data,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ImportsCollectionFile":
+        """Build the collection from the representation given by to_dict"""
+        collection = cls()
+        collection.plugins_data = data.get("plugins_data", {})
+        for statement in data.get("imports", []):
+            collection.register_import(**statement)
+        for statement in [
+            *data.get("relative_imports", []),
+            *data.get("absolute_imports", []),
+        ]:
+            collection.register_import_from(**statement)
+        return collection
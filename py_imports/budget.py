@@ -0,0 +1,171 @@
+"""Budgets for the modules loaded when an entry point is imported"""
+from collections import deque
+from typing import Collection, Dict, Iterable, List, Optional
+
+from py_imports.graph import ImportGraph
+
+
+class ImportBudget:
+    """
+    Class that represent the limits of the modules loaded by an entry point
+    """
+
+    def __init__(
+        self,
+        entry: str,
+        max_modules: Optional[int] = None,
+        forbidden: Iterable[str] = (),
+    ) -> None:
+        """Initialize the budget
+        Args:
+            entry: Module name or path of the entry point, ex. "pkg.cli"
+            max_modules: Max amount of modules loaded by the entry point, None to not
+                limit it
+            forbidden: Packages that must not be loaded at import time, ex. "pandas",
+                their submodules are forbidden too
+        """
+        self.entry = entry
+        self.max_modules = max_modules
+        self.forbidden = list(forbidden)
+
+
+class BudgetViolation:
+    """
+    Class that represent a budget exceeded by an entry point
+    """
+
+    def __init__(self, entry: str, reason: str, chain: List[str], message: str) -> None:
+        """Initialize the violation
+        Args:
+            entry: Module name of the entry point
+            reason: "forbidden", "max_modules" or "unknown_entry" (not parsed)
+            chain: Chain of imports from the entry point to the offending module
+            message: Description of the violation
+        """
+        self.entry = entry
+        self.reason = reason
+        self.chain = chain
+        self.message = message
+
+    def __str__(self) -> str:
+        return self.message
+
+
+class ImportBudgetChecker:
+    """
+    Check the budgets of the entry points with the runtime import closure
+
+    Notes:
+        The closure is every module loaded, directly or not, when the entry point is
+        imported. Just the imports executed at import time are followed, see
+        runtime_relevance, the parent packages of a module are loaded too. The
+        modules not parsed (external modules) are counted by the dotted name imported
+    """
+
+    RUNTIME_RELEVANCES = frozenset({"always", "conditional", "optional"})
+
+    def __init__(
+        self, graph: ImportGraph, relevances: Collection[str] = RUNTIME_RELEVANCES
+    ) -> None:
+        """
+        Args:
+            graph: graph of the modules parsed
+            relevances: runtime relevance of the imports followed, by default the imports
+                that could be executed at import time
+        """
+        self.graph = graph
+        self.relevances = relevances
+
+    def _runtime_dependencies(self, module: str) -> List[str]:
+        """Get the modules loaded at import time by the module"""
+        return [
+            target
+            for target, statements in self.graph.dependencies.get(module, {}).items()
+            if not statements
+            or any(
+                statement.runtime_relevance in self.relevances for statement in statements
+            )
+        ]
+
+    def closure(self, entry: str) -> Dict[str, Optional[str]]:
+        """Get the modules loaded by the entry point
+
+        Returns:
+            Dict: every module loaded with the module that imports it first (breadth
+                first), the entry point has None
+        """
+        predecessors: Dict[str, Optional[str]] = {entry: None}
+        pending = deque([entry])
+        while pending:
+            module = pending.popleft()
+            for dependency in self._runtime_dependencies(module):
+                if dependency not in predecessors:
+                    predecessors[dependency] = module
+                    pending.append(dependency)
+        return predecessors
+
+    @staticmethod
+    def chain(predecessors: Dict[str, Optional[str]], module: str) -> List[str]:
+        """Get the shortest chain of imports from the entry point to the module"""
+        chain = [module]
+        predecessor = predecessors[module]
+        while predecessor is not None:
+            chain.insert(0, predecessor)
+            predecessor = predecessors[predecessor]
+        return chain
+
+    def check(self, budget: ImportBudget) -> List[BudgetViolation]:
+        """Get the violations of the budget"""
+        entry = budget.entry
+        if entry.endswith(".py"):
+            entry = self.graph.module_key(entry)
+
+        if not self.graph.is_internal(entry):
+            # Otherwise the closure is just the entry and every budget would pass
+            message = f"{entry} was not parsed, its budget can not be checked"
+            return [BudgetViolation(entry, "unknown_entry", [entry], message)]
+
+        violations = []
+        predecessors = self.closure(entry)
+        for package in budget.forbidden:
+            # The modules are in breadth first order, the first one has the shortest chain
+            module = next(
+                (
+                    module
+                    for module in predecessors
+                    if module == package or module.startswith(package + ".")
+                ),
+                None,
+            )
+            if module is None:
+                continue
+
+            chain = self.chain(predecessors, module)
+            message = (
+                f"{entry} imports the forbidden package {package} at import time: "
+                f"{' -> '.join(chain)}"
+            )
+            violations.append(BudgetViolation(entry, "forbidden", chain, message))
+
+        # The entry point itself is not counted
+        loaded_modules = len(predecessors) - 1
+        if budget.max_modules is not None and loaded_modules > budget.max_modules:
+            # Counted like loaded_modules, without the entry reached through cycles
+            closures = {
+                dependency: len(set(self.closure(dependency)) - {entry})
+                for dependency in self._runtime_dependencies(entry)
+            }
+            heaviest = max(closures, key=closures.__getitem__)
+            message = (
+                f"{entry} loads {loaded_modules} modules at import time, the max is "
+                f"{budget.max_modules}, the heaviest import is {entry} -> {heaviest} "
+                f"({closures[heaviest]} modules)"
+            )
+            violations.append(
+                BudgetViolation(entry, "max_modules", [entry, heaviest], message)
+            )
+        return violations
+
+    def check_all(self, budgets: Iterable[ImportBudget]) -> List[BudgetViolation]:
+        """Get the violations of every budget"""
+        return [violation for budget in budgets for violation in self.check(budget)]
@@ -0,0 +1,104 @@
+"""Helpers to scan the distributions installed in an environment"""
+import hashlib
+import os
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from py_imports.requirements import (
+    canonical_name,
+    check_metadata_support,
+    importlib_metadata,
+)
+
+
+# Files that list the files installed by a distribution, by priority
+RECORD_FILES = ("RECORD", "installed-files.txt", "SOURCES.txt")
+
+
+def installed_distributions(path: Optional[List[str]] = None) -> Iterator[Any]:
+    """Get the distributions installed, just the first one found by name
+
+    Args:
+        path: directories where the distributions are installed, sys.path by default
+
+    Raises:
+        UnsupportedPythonVersion: If importlib.metadata is not available
+    """
+    check_metadata_support()
+    seen = set()
+    distributions = (
+        importlib_metadata.distributions()
+        if path is None
+        else importlib_metadata.distributions(path=path)
+    )
+    for distribution in distributions:
+        name = distribution.metadata["Name"]
+        if not name or canonical_name(name) in seen:
+            continue
+        seen.add(canonical_name(name))
+        yield distribution
+
+
+def distribution_py_files(distribution: Any) -> List[str]:
+    """Get the absolute paths of the .py files installed by the distribution"""
+    paths = []
+    for file in distribution.files or []:
+        if file.suffix != ".py":
+            continue
+        path = os.path.normpath(str(distribution.locate_file(file)))
+        if os.path.isfile(path):
+            paths.append(path)
+    return sorted(paths)
+
+
+def distribution_cache_key(distribution: Any, extra: Sequence[str] = ()) -> str:
+    """Get the key of the cache of the distribution
+
+    The key has the name, the scope, the version and the hash of the files installed
+    (RECORD), so it changes when the distribution is upgraded or reinstalled. The
+    scope is the hash of the location of the distribution and the extra values, so
+    several environments and plugins can share the cache, the artifacts have absolute
+    paths
+    Args:
+        distribution: distribution installed
+        extra: other values that change the result of the scan, ex. the plugins
+    """
+    record = next(
+        (
+            content
+            for content in map(distribution.read_text, RECORD_FILES)
+            if content is not None
+        ),
+        "",
+    )
+    scope = hashlib.sha256(str(distribution.locate_file("")).encode("utf-8"))
+    for value in extra:
+        scope.update(value.encode("utf-8"))
+
+    name = canonical_name(distribution.metadata["Name"])
+    version = distribution.version
+    digest = hashlib.sha256(record.encode("utf-8")).hexdigest()[:16]
+    return f"{name}__{scope.hexdigest()[:16]}__{version}__{digest}"
+
+
+def prune_cache(cache_dir: str, cache_key: str) -> None:
+    """Remove the cache of the other versions of the distribution in the same scope,
+    see distribution_cache_key
+    """
+    name, scope = cache_key.split("__")[:2]
+    for file_name in os.listdir(cache_dir):
+        if (
+            file_name.startswith(f"{name}__{scope}__")
+            and file_name != f"{cache_key}.json"
+        ):
+            os.remove(os.path.join(cache_dir, file_name))
+
+
+def cache_paths(cache_dir: str) -> Dict[str, str]:
+    """Get the path of every file of the cache by key"""
+    if not os.path.isdir(cache_dir):
+        return {}
+    return {
+        os.path.splitext(file_name)[0]: os.path.join(cache_dir, file_name)
+        for file_name in os.listdir(cache_dir)
+        if file_name.endswith(".json")
+    }
@@ -1,6 +1,7 @@
 """
 Custom exceptions for py_imports
 """
+from typing import Any, List
 
 
 class RequiredBaseDirError(Exception):
@@ -13,3 +14,43 @@ class WrongFileExtension(Exception):
     """
     Exception to handle when the file provided is not the extension expected
     """
+
+
+class WrongShardConfiguration(Exception):
+    """
+    Exception to handle when the shard is not in the range of the shards expected
+    """
+
+
+class WrongMemoryConfiguration(Exception):
+    """
+    Exception to handle when the memory limits of a bounded scan are not valid
+    """
+
+
+class WrongArtifactFormat(Exception):
+    """
+    Exception to handle when the artifact provided was not generated by py_imports
+    """
+
+
+class UnsupportedRequirementsFile(Exception):
+    """
+    Exception to handle when the requirements file can not be parsed
+    """
+
+
+class UnsupportedPythonVersion(Exception):
+    """
+    Exception to handle when a feature is not supported in the current python version
+    """
+
+
+class ImportBudgetExceeded(Exception):
+    """
+    Exception to handle when an entry point exceeds its import budget
+    """
+
+    def __init__(self, violations: List[Any]) -> None:
+        self.violations = violations
+        super().__init__("\n".join(str(violation) for violation in violations))
@@ -0,0 +1,305 @@
+"""Remove the unused imports from py files"""
+import ast
+import difflib
+import io
+import os
+import re
+import sys
+import tempfile
+import tokenize
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from py_imports.exceptions import UnsupportedPythonVersion
+from py_imports.mixins import UnUsedImportMixin
+
+
+ImportNode = Union[ast.Import, ast.ImportFrom]
+
+# The end positions of the ast nodes (end_lineno, end_col_offset) exist in python 3.8+
+END_POSITIONS = sys.version_info >= (3, 8)
+
+# Comment to ignore the errors of a line, bare or with the codes, ex. "# noqa: F401"
+NOQA = re.compile(
+    r"#\s*noqa(?::[\s]?(?P<codes>[A-Z][0-9]+(?:[,\s]+[A-Z][0-9]+)*))?", re.I
+)
+
+
+def check_python_version() -> None:
+    """Validate if the python version supports the fixer
+
+    Raises:
+        UnsupportedPythonVersion: If the python version is 3.7 or lower
+    """
+    if not END_POSITIONS:
+        raise UnsupportedPythonVersion(
+            "The unused imports fixer requires python 3.8+, the statements are "
+            "located with the end positions of the ast nodes"
+        )
+
+
+class FixResult:
+    """
+    Class to collect the result of removing the unused imports in a file
+    """
+
+    def __init__(
+        self,
+        path: str,
+        removed: List[str],
+        diff: str = "",
+        error: Optional[str] = None,
+    ) -> None:
+        """Initialize the fix result
+        Args:
+            path: Path of the file fixed
+            removed: Imports removed, as pyflakes describe them, ex. "numpy as np"
+            diff: Unified diff of the changes
+            error: Description of the error, if the file could not be fixed
+        """
+        self.path = path
+        self.removed = removed
+        self.diff = diff
+        self.error = error
+
+    @property
+    def changed(self) -> bool:
+        """If the file has changes"""
+        return bool(self.diff)
+
+
+class UnusedImportFixer(UnUsedImportMixin):
+    """
+    Rewrite the source code without the unused imports
+
+    Notes:
+        The statements are located with the start and end positions of the ast nodes
+        (python 3.8+), so the multi-line and parenthesized imports are supported.
+        A statement with some children used is rebuilt just with them, the comments
+        inside of it are lost. A statement without children used is removed, or
+        replaced with "pass" when it shares the line or it's the only statement in
+        its block.
+    """
+
+    def __init__(self, raw_content: str) -> None:
+        check_python_version()
+        self.raw_content = raw_content
+        self.lines = io.StringIO(raw_content, newline="").readlines()
+
+    @staticmethod
+    def binding_name(node: ImportNode, alias: ast.alias) -> str:
+        """Get the name of the alias in the same way that pyflakes describe it
+
+        Examples:
+            import numpy as np -> "numpy as np"
+            from . import foo -> ".foo"
+            from ..module import foo -> "..module.foo"
+        """
+        name = alias.name
+        if isinstance(node, ast.ImportFrom):
+            module = "." * node.level + (node.module or "")
+            name = f"{module}{name}" if module.endswith(".") else f"{module}.{name}"
+        return f"{name} as {alias.asname}" if alias.asname else name
+
+    @staticmethod
+    def alias_source(alias: ast.alias) -> str:
+        """Get the source code of the alias"""
+        return f"{alias.name} as {alias.asname}" if alias.asname else alias.name
+
+    def _offset(self, line: int, col_offset: int) -> int:
+        """Convert the utf-8 byte offset of the ast node to an offset in characters"""
+        return len(self.lines[line - 1].encode("utf-8")[:col_offset].decode("utf-8"))
+
+    def _statement_source(self, node: ImportNode, aliases: List[ast.alias]) -> str:
+        """Build the statement importing just the aliases provided"""
+        if isinstance(node, ast.Import):
+            prefix = "import "
+        else:
+            prefix = f"from {'.' * node.level}{node.module or ''} import "
+
+        names = [self.alias_source(alias) for alias in aliases]
+        if node.lineno == node.end_lineno or isinstance(node, ast.Import):
+            return prefix + ", ".join(names)
+
+        # Keep the multi-line statements parenthesized, one child per line
+        line = self.lines[node.lineno - 1]
+        indentation = line[: len(line) - len(line.lstrip())] + " " * 4
+        newline = line[len(line.rstrip("\r\n")) :] or "\n"  # noqa: E203
+        children = "".join(f"{indentation}{name},{newline}" for name in names)
+        return f"{prefix}({newline}{children}{indentation[:-4]})"
+
+    def _ignored(self, node: ImportNode) -> bool:
+        """Check if a line of the statement has a noqa comment that ignores F401"""
+        for line in range(node.lineno, node.end_lineno + 1):  # type: ignore
+            match = NOQA.search(self.lines[line - 1])
+            if match and (
+                not match.group("codes")
+                or "F401" in re.split(r"[,\s]+", match.group("codes").upper())
+            ):
+                return True
+        return False
+
+    def _unused_bindings(self) -> Set[Tuple[int, str]]:
+        """Get the line and binding of every import not used"""
+        return {
+            (alert.lineno, binding)
+            for alert in self.get_unused_import_alerts()
+            for binding in alert.message_args
+        }
+
+    @staticmethod
+    def _import_nodes(tree: ast.AST) -> List[Tuple[ImportNode, List[Any]]]:
+        """Get the import statements with the body that contains them"""
+        nodes = []
+        for parent in ast.walk(tree):
+            for field in ("body", "orelse", "finalbody"):
+                body = getattr(parent, field, None)
+                if not isinstance(body, list):
+                    continue
+                for child in body:
+                    if isinstance(child, (ast.Import, ast.ImportFrom)):
+                        nodes.append((child, body))
+        return nodes
+
+    def _replace(self, node: ImportNode, replacement: Optional[str]) -> None:
+        """Replace the statement in the lines, or remove them if replacement is None"""
+        start = self._offset(node.lineno, node.col_offset)
+        end = self._offset(node.end_lineno, node.end_col_offset)  # type: ignore
+        first_line = self.lines[node.lineno - 1]
+        last_line = self.lines[node.end_lineno - 1]  # type: ignore
+        prefix, suffix = first_line[:start], last_line[end:]
+
+        is_alone = not prefix.strip() and (
+            not suffix.strip() or suffix.lstrip().startswith("#")
+        )
+        if replacement is None and is_alone:
+            del self.lines[node.lineno - 1 : node.end_lineno]  # noqa: E203
+            return
+
+        new_line = prefix + (replacement if replacement is not None else "pass") + suffix
+        self.lines[node.lineno - 1 : node.end_lineno] = [new_line]  # noqa: E203
+
+    def fix(self) -> Tuple[str, List[str]]:
+        """Remove the unused imports
+
+        Returns:
+            Tuple: the source code fixed and the imports removed
+        """
+        tree = ast.parse(self.raw_content)
+        unused = self._unused_bindings()
+        if not unused:
+            return self.raw_content, []
+
+        removed: List[str] = []
+        edits: List[Tuple[ImportNode, Optional[str]]] = []
+        removed_by_body: Dict[int, Tuple[List[Any], List[ImportNode]]] = {}
+        for node, body in self._import_nodes(tree):
+            # pyflakes reports a star import as unused when no undefined name is used,
+            # but the names it defines can be used by other modules, ex. settings
+            if isinstance(node, ast.ImportFrom) and (
+                node.module == "__future__" or node.names[0].name == "*"
+            ):
+                continue
+            if self._ignored(node):
+                continue
+
+            bindings = [(alias, self.binding_name(node, alias)) for alias in node.names]
+            kept = [
+                alias for alias, name in bindings if (node.lineno, name) not in unused
+            ]
+            if len(kept) == len(node.names):
+                continue
+
+            removed.extend(name for alias, name in bindings if alias not in kept)
+            if kept:
+                edits.append((node, self._statement_source(node, kept)))
+            else:
+                removed_by_body.setdefault(id(body), (body, []))[1].append(node)
+
+        for body, nodes in removed_by_body.values():
+            # A block can not be empty, the first statement removed is kept as "pass"
+            empty_block = len(nodes) == len(body) and body is not getattr(tree, "body")
+            for index, node in enumerate(nodes):
+                edits.append((node, "pass" if empty_block and index == 0 else None))
+
+        for node, replacement in sorted(
+            edits, key=lambda edit: (edit[0].lineno, edit[0].col_offset), reverse=True
+        ):
+            self._replace(node, replacement)
+
+        return "".join(self.lines), removed
+
+
+def write_atomic(path: str, content: bytes) -> None:
+    """Replace the content of the file, the file is never left half-written
+
+    The content is written in a temporal file in the same directory, then it's
+    renamed over the original file, keeping its permissions
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporal_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(content)
+        os.chmod(temporal_path, os.stat(path).st_mode)
+        os.replace(temporal_path, path)
+    except BaseException:
+        os.unlink(temporal_path)
+        raise
+
+
+def fix_file(path: str, dry_run: bool = False) -> FixResult:
+    """Remove the unused imports in the file
+
+    The file is just written when there are changes
+    Args:
+        path: path of the .py file
+        dry_run: just get the diff, without writing the file
+    """
+    try:
+        with open(path, "rb") as file:
+            source = file.read()
+        encoding, _ = tokenize.detect_encoding(io.BytesIO(source).readline)
+        raw_content = source.decode(encoding)
+        fixed_content, removed = UnusedImportFixer(raw_content).fix()
+        # The source code must be still valid, otherwise the file is not modified
+        ast.parse(fixed_content)
+    except (OSError, SyntaxError, UnicodeDecodeError, ValueError) as error:
+        return FixResult(path, [], error=f"{type(error).__name__}: {error}")
+
+    if fixed_content == raw_content:
+        return FixResult(path, [])
+
+    diff = "".join(
+        difflib.unified_diff(
+            io.StringIO(raw_content, newline="").readlines(),
+            io.StringIO(fixed_content, newline="").readlines(),
+            fromfile=path,
+            tofile=path,
+        )
+    )
+    if not dry_run:
+        write_atomic(path, fixed_content.encode(encoding))
+    return FixResult(path, removed, diff)
+
+
+def fix_files(
+    paths: Iterable[str], dry_run: bool = False, workers: Optional[int] = None
+) -> List[FixResult]:
+    """Remove the unused imports in the files, in parallel processes
+
+    Args:
+        paths: paths of the .py files
+        dry_run: just get the diffs, without writing the files
+        workers: amount of processes, by default the amount of CPUs. With 1 the files
+            are fixed in the current process
+    """
+    check_python_version()
+    paths = list(paths)
+    if workers == 1 or len(paths) <= 1:
+        return [fix_file(path, dry_run) for path in paths]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(fix_file, paths, [dry_run] * len(paths), chunksize=16))
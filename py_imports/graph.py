@@ -0,0 +1,267 @@
+"""Graph of the dependencies between the modules parsed"""
+import logging
+import os
+from collections import Counter, deque
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from py_imports.base.models import (
+    ImportFromStatement,
+    ImportsCollectionFile,
+    ImportStatement,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class ImpactReport:
+    """
+    Class to collect the modules and files affected by a change
+    """
+
+    def __init__(
+        self, modules: List[str], files: List[str], test_files: List[str]
+    ) -> None:
+        """Initialize the impact report
+        Args:
+            modules: Modules changed and modules that import them, directly or not
+            files: Paths of the modules affected that were parsed
+            test_files: Paths of the test files affected, a subset of files
+        """
+        self.modules = modules
+        self.files = files
+        self.test_files = test_files
+
+
+class ImportGraph:
+    """
+    Graph of the modules parsed, with an edge from every module to the modules it imports
+
+    Notes:
+        The imports are resolved to the modules parsed (internal modules), when it's
+        not possible, the target is the full dotted name imported (external modules).
+        A module also depends on its parent packages, because they are executed
+        when it's imported. When several files get the same module name, ex. two
+        test_api.py outside of any package, the normalized path is used as the name
+        of every one of them, see module_key
+    """
+
+    TEST_FILE_PREFIX = "test_"
+    TEST_FILE_SUFFIX = "_test.py"
+    CONFTEST_FILE = "conftest.py"
+
+    def __init__(
+        self,
+        imports: Dict[str, ImportsCollectionFile],
+        roots: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Build the graph of the imports parsed
+        Args:
+            imports: imports parsed by path, ex. PyImports.imports_resume()
+            roots: source directories, the module names are relative to them. By default
+                the name is built with the packages (directories with __init__.py)
+                around the file
+        """
+        self.roots = sorted(
+            (self.normalize_path(root) for root in roots or []), key=len, reverse=True
+        )
+        self.modules: Dict[str, str] = {}
+        self.packages: Set[str] = set()
+        self.dependencies: Dict[str, Dict[str, List[ImportStatement]]] = {}
+        self.dependents: Dict[str, Set[str]] = {}
+
+        names = {self.normalize_path(path): self.module_name(path) for path in imports}
+        collisions = {
+            name for name, count in Counter(names.values()).items() if count > 1
+        }
+        if collisions:
+            logger.warning(
+                "Modules with the same name, their paths are used as names, provide "
+                "the roots to avoid it: %s",
+                ", ".join(sorted(collisions)),
+            )
+        # Module name of every path parsed
+        self._keys = {
+            path: path if name in collisions else name for path, name in names.items()
+        }
+
+        for path in imports:
+            module = self.module_key(path)
+            self.modules[module] = self.normalize_path(path)
+            if self.is_package_init(path):
+                self.packages.add(module)
+
+        for path, collection in imports.items():
+            self._add_edges(self.module_key(path), collection)
+
+    @staticmethod
+    def normalize_path(path: str) -> str:
+        """Get the absolute and normalized version of the path"""
+        return os.path.normcase(os.path.abspath(path))
+
+    @staticmethod
+    def is_package_init(path: str) -> bool:
+        """Validate if the path is the __init__.py of a package"""
+        return os.path.basename(path) == "__init__.py"
+
+    def module_name(self, path: str) -> str:
+        """Get the dotted name of the module in the path
+
+        Examples:
+            src/pkg/__init__.py -> pkg
+            src/pkg/module.py -> pkg.module
+        """
+        normalized_path = self.normalize_path(path)
+        directory, file_name = os.path.split(normalized_path)
+        parts = [] if file_name == "__init__.py" else [os.path.splitext(file_name)[0]]
+
+        root = next(
+            (root for root in self.roots if normalized_path.startswith(root + os.sep)),
+            None,
+        )
+        if root is not None:
+            relative_directory = os.path.relpath(directory, root)
+            packages = (
+                [] if relative_directory == "." else relative_directory.split(os.sep)
+            )
+        else:
+            packages = []
+            while os.path.isfile(os.path.join(directory, "__init__.py")):
+                directory, package = os.path.split(directory)
+                packages.insert(0, package)
+
+        return ".".join(packages + parts)
+
+    def module_key(self, path: str) -> str:
+        """Get the name of the module in the graph
+
+        It's the module name, or the normalized path if another file parsed has the
+        same module name
+        """
+        normalized_path = self.normalize_path(path)
+        return self._keys.get(normalized_path) or self.module_name(normalized_path)
+
+    def is_internal(self, module: str) -> bool:
+        """Validate if the module was parsed"""
+        return module in self.modules
+
+    def _resolve_name(self, name: str) -> List[str]:
+        """Get the internal modules executed when the dotted name is imported
+
+        Returns:
+            List: every package in the name that was parsed, ex. a, a.b, a.b.c for
+                a.b.c, or the full name if none was parsed
+        """
+        segments = name.split(".")
+        prefixes = [".".join(segments[: index + 1]) for index in range(len(segments))]
+        internal = [prefix for prefix in prefixes if self.is_internal(prefix)]
+        return internal or [name]
+
+    def _relative_base(self, module: str, statement: ImportFromStatement) -> str:
+        """Get the absolute name of the module imported with a relative import"""
+        package = module if module in self.packages else module.rpartition(".")[0]
+        segments = package.split(".") if package else []
+        if statement.level > 1:
+            segments = segments[: len(segments) - (statement.level - 1)]
+        if statement.parent:
+            segments.append(statement.parent)
+        return ".".join(segments)
+
+    def resolve(self, module: str, statement: ImportStatement) -> List[str]:
+        """Get the modules executed by the import statement in the module"""
+        if not isinstance(statement, ImportFromStatement):
+            return [
+                target
+                for child in statement.children
+                for target in self._resolve_name(child)
+            ]
+
+        if statement.level:
+            base = self._relative_base(module, statement)
+        else:
+            base = statement.parent
+        targets = self._resolve_name(base) if base else []
+        for child in statement.children:
+            submodule = f"{base}.{child}" if base else child
+            if self.is_internal(submodule):
+                targets.append(submodule)
+        return targets
+
+    def _add_edge(
+        self, module: str, target: str, statement: Optional[ImportStatement]
+    ) -> None:
+        """Add the edge between the module and the module imported"""
+        if target == module:
+            return
+        statements = self.dependencies.setdefault(module, {}).setdefault(target, [])
+        if statement is not None:
+            statements.append(statement)
+        self.dependents.setdefault(target, set()).add(module)
+
+    def _add_edges(self, module: str, collection: ImportsCollectionFile) -> None:
+        """Add the edges of the imports in the module"""
+        self.dependencies.setdefault(module, {})
+        for package in self._resolve_name(module.rpartition(".")[0]):
+            if self.is_internal(package):
+                self._add_edge(module, package, None)
+
+        statements: List[ImportStatement] = [
+            *collection.imports,
+            *collection.absolute_imports,
+            *collection.relative_imports,
+        ]
+        for statement in statements:
+            for target in self.resolve(module, statement):
+                self._add_edge(module, target, statement)
+
+    def dependents_closure(self, modules: Iterable[str]) -> Set[str]:
+        """Get the modules provided and every module that imports them, directly or not"""
+        closure = set(modules)
+        pending = deque(closure)
+        while pending:
+            module = pending.popleft()
+            for dependent in self.dependents.get(module, ()):
+                if dependent not in closure:
+                    closure.add(dependent)
+                    pending.append(dependent)
+        return closure
+
+    def is_test_file(self, path: str) -> bool:
+        """Validate if the path is a test file, according to the pytest conventions"""
+        file_name = os.path.basename(path)
+        return file_name.endswith(".py") and (
+            file_name.startswith(self.TEST_FILE_PREFIX)
+            or file_name.endswith(self.TEST_FILE_SUFFIX)
+        )
+
+    def affected_by(self, changed_files: Iterable[str]) -> ImpactReport:
+        """Get the modules and test files affected by the files changed
+
+        Args:
+            changed_files: paths of the files modified, added or removed
+
+        Notes:
+            A conftest.py changed affects every test file in its directory
+        """
+        changed_paths = [self.normalize_path(path) for path in changed_files]
+        changed_modules = {
+            self.module_key(path) for path in changed_paths if path.endswith(".py")
+        }
+        conftest_directories = tuple(
+            os.path.dirname(path) + os.sep
+            for path in changed_paths
+            if os.path.basename(path) == self.CONFTEST_FILE
+        )
+        if conftest_directories:
+            changed_modules.update(
+                module
+                for module, path in self.modules.items()
+                if path.startswith(conftest_directories) and self.is_test_file(path)
+            )
+
+        modules = sorted(self.dependents_closure(changed_modules))
+        files = sorted(
+            self.modules[module] for module in modules if self.is_internal(module)
+        )
+        test_files = [path for path in files if self.is_test_file(path)]
+        return ImpactReport(modules, files, test_files)
@@ -0,0 +1,179 @@
+"""Inverted index to know which files import a module or name"""
+import threading
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from py_imports.base.models import ImportFromStatement, ImportsCollectionFile
+
+
+# (path, line) where a module or name is imported
+Posting = Tuple[str, int]
+
+
+class _TrieNode:
+    """
+    Node of the trie, there is a node for every segment of a dotted name
+    """
+
+    __slots__ = ("children", "postings")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.postings: Set[Posting] = set()
+
+    def walk(self) -> Iterator["_TrieNode"]:
+        """Get the node and every node below it"""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(node.children.values())
+
+
+class ImportsIndex:
+    """
+    Map the dotted names of modules and imported objects to the files and lines
+    where they are imported
+
+    Notes:
+        The names are saved in a trie over the dotted segments, so a prefix query
+        like "django.db.*" only traverses the names below "django.db". The relative
+        names keep the leading dots as their first segment, ex. "..utils.foo".
+        The updates and the queries are guarded by a lock, so the index can be queried
+        while the files are registered from other threads
+    """
+
+    WILDCARD = "*"
+
+    def __init__(self, lock: Optional[threading.RLock] = None) -> None:
+        """Initialize the index
+        Args:
+            lock: lock shared with the owner of the index, ex. PyImports, by default
+                the index has its own lock
+        """
+        self._lock = lock or threading.RLock()
+        self._root = _TrieNode()
+        self._names_by_path: Dict[str, Set[Tuple[Tuple[str, ...], Posting]]] = {}
+
+    @staticmethod
+    def split_name(name: str) -> Tuple[str, ...]:
+        """Split a dotted name in its segments
+
+        Examples:
+            "django.db" -> ("django", "db")
+            "..utils.foo" -> ("..", "utils", "foo")
+        """
+        dotted_name = name.lstrip(".")
+        level = len(name) - len(dotted_name)
+        segments = tuple(dotted_name.split(".")) if dotted_name else ()
+        return ("." * level,) + segments if level else segments
+
+    @staticmethod
+    def names_imported(collection: ImportsCollectionFile) -> Iterator[Tuple[str, int]]:
+        """Get the modules and objects imported in a file with the line of the import
+
+        Examples:
+            import a.b -> "a.b"
+            from a.b import c -> "a.b", "a.b.c"
+            from ..a import c -> "..a", "..a.c"
+        """
+        for statement in collection.imports:
+            for child in statement.children:
+                yield child, statement.line
+
+        from_statements: List[ImportFromStatement] = [
+            *collection.absolute_imports,
+            *collection.relative_imports,
+        ]
+        for from_statement in from_statements:
+            module = "." * from_statement.level + from_statement.parent
+            yield module, from_statement.line
+            separator = "." if from_statement.parent else ""
+            for child in from_statement.children:
+                if child != ImportsIndex.WILDCARD:
+                    yield f"{module}{separator}{child}", from_statement.line
+
+    def _node(self, segments: Tuple[str, ...], create: bool = False) -> "_TrieNode":
+        """Get the node of the segments provided
+
+        Raises:
+            KeyError: If the node does not exist and it's not created
+        """
+        node = self._root
+        for segment in segments:
+            if segment not in node.children:
+                if not create:
+                    raise KeyError(segment)
+                node.children[segment] = _TrieNode()
+            node = node.children[segment]
+        return node
+
+    def add(self, path: str, collection: ImportsCollectionFile) -> None:
+        """Index the imports of a file, replacing the entries of a previous scan
+        Args:
+            path: path of the file scanned
+            collection: imports found in the file
+        """
+        with self._lock:
+            self.remove(path)
+            entries = set()
+            for name, line in self.names_imported(collection):
+                segments = self.split_name(name)
+                posting = (path, line)
+                self._node(segments, create=True).postings.add(posting)
+                entries.add((segments, posting))
+            self._names_by_path[path] = entries
+
+    def remove(self, path: str) -> None:
+        """Remove the imports of a file from the index"""
+        with self._lock:
+            for segments, posting in self._names_by_path.pop(path, set()):
+                parents = [self._root]
+                for segment in segments:
+                    parents.append(parents[-1].children[segment])
+                parents[-1].postings.discard(posting)
+
+                # Prune the nodes that do not lead to any posting anymore
+                for segment, parent in zip(reversed(segments), reversed(parents[:-1])):
+                    child = parent.children[segment]
+                    if child.postings or child.children:
+                        break
+                    del parent.children[segment]
+
+    def lookup(self, name: str) -> List[Posting]:
+        """Get the files and lines where the name is imported
+
+        Args:
+            name: dotted name of the module or object, ex. "requests.Session", if it
+                ends with ".*" every name below the prefix is matched, ex. "django.db.*"
+
+        Returns:
+            List: (path, line) sorted
+        """
+        prefix_query = name.endswith("." + self.WILDCARD) or name == self.WILDCARD
+        segments = self.split_name(name[:-1].rstrip(".") if prefix_query else name)
+        with self._lock:
+            try:
+                node = self._node(segments)
+            except KeyError:
+                return []
+
+            if not prefix_query:
+                return sorted(node.postings)
+
+            postings: Set[Posting] = set()
+            for child in node.children.values():
+                for descendant in child.walk():
+                    postings.update(descendant.postings)
+        return sorted(postings)
+
+    def files_importing(self, name: str) -> List[str]:
+        """Get the files where the name is imported, see lookup"""
+        return sorted({path for path, _ in self.lookup(name)})
+
+    def __contains__(self, path: object) -> bool:
+        with self._lock:
+            return path in self._names_by_path
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._names_by_path)
@@ -1,32 +1,100 @@
 """Core feature to get imports"""
 import ast
+import io
+import json
 import logging
 import os
+import re
+import tempfile
+import threading
+import tokenize
+import zlib
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from types import TracebackType
-from typing import Dict, List, NoReturn, Optional, Type, TypeVar, Union, cast
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NoReturn,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from typing_extensions import Literal
 
-from py_imports.ast_analyzers import AstImportAnalyzer
-from py_imports.base.models import ImportsCollectionFile
-from py_imports.exceptions import WrongFileExtension
+from py_imports.ast_analyzers import AstImportAnalyzer, TokenImportAnalyzer
+from py_imports.base.models import ImportsCollectionFile, ScanError
+from py_imports.budget import BudgetViolation, ImportBudget, ImportBudgetChecker
+from py_imports.environment import (
+    cache_paths,
+    distribution_cache_key,
+    distribution_py_files,
+    installed_distributions,
+    prune_cache,
+)
+from py_imports.exceptions import (
+    ImportBudgetExceeded,
+    WrongArtifactFormat,
+    WrongFileExtension,
+    WrongMemoryConfiguration,
+    WrongShardConfiguration,
+)
+from py_imports.fixer import FixResult, fix_files
+from py_imports.graph import ImpactReport, ImportGraph
+from py_imports.index import ImportsIndex
 from py_imports.mixins import UnUsedImportMixin
+from py_imports.plugins import AnalyzerPlugin
+from py_imports.requirements import (
+    RequirementsAudit,
+    RequirementsReport,
+    parse_requirements_file,
+)
+from py_imports.spill import (
+    SpilledImports,
+    SpillRecord,
+    SpillWriter,
+    current_rss,
+)
+from py_imports.stats import ImportStatistics
 
 
 _PyImports = TypeVar("_PyImports", bound="PyImports")
 
+# Encoding declaration of the source (PEP 263)
+ENCODING_COOKIE = re.compile(r"^[ \t\f]*#.*?coding[:=][ \t]*[-\w.]+", re.ASCII)
+
+ARTIFACT_FORMAT = "py_imports"
+ARTIFACT_VERSION = 1
+
 logger = logging.getLogger(__name__)
 
 
-class PyImports(UnUsedImportMixin):
+class PyImports(UnUsedImportMixin):  # pylint: disable=R0904
     """
     Parse and capture every import data statement in a directory, file
     """
 
     def __init__(
         self,
+        resilient: bool = False,
+        plugins: Sequence[Type[AnalyzerPlugin]] = (),
     ) -> None:
         """Parse the imports from a directory or file
+
+        Args:
+            resilient: If it's enabled, the files that can not be read or parsed
+                do not abort the scan, the error is registered (see errors_resume) and
+                the imports are recovered with the tokenizer as far as possible
+            plugins: Classes of the plugins run while every file is parsed, the results
+                are attached to the ImportsCollectionFile, see AnalyzerPlugin
         Examples:
                 1. Parse imports in an specific local directory
                     ...
@@ -37,8 +105,42 @@ class PyImports(UnUsedImportMixin):
                     ...
                     with PyImports() as manager:
                         manager.get_imports(path=FILE_PATH)
+
+                3. Parse the imports of a directory split in shards, ex. in several
+                   CI nodes, and merge the results
+                    ...
+                    with PyImports() as manager:
+                        manager.get_imports(path=DIR_PATH, shard=0, num_shards=4)
+                        manager.dump(ARTIFACT_PATH)
+                    ...
+                    with PyImports() as manager:
+                        manager.load(*ARTIFACT_PATHS)
+
+                4. Parse imports from source code already loaded in memory
+                    ...
+                    with PyImports() as manager:
+                        manager.get_imports_from_source(SOURCE, name="main.py")
+
+                5. Parse the files of a directory in a pool of threads
+                    ...
+                    with PyImports() as manager:
+                        manager.get_imports(path=DIR_PATH, workers=8)
+
+        Notes:
+            The manager is thread-safe, the results are registered with a lock. Every
+            file is parsed in its own ast, so the analyzers never share nodes. In
+            free-threaded builds of CPython (3.13t) the threads parse in parallel
         """
+        self.resilient = resilient
+        self.plugins = plugins
+        # Guard the results registered, the index, the statistics and the graph cached
+        self._lock = threading.RLock()
         self._imports: Dict[str, ImportsCollectionFile] = {}
+        self._errors: Dict[str, List[ScanError]] = {}
+        self._index = ImportsIndex(self._lock)
+        self._statistics = ImportStatistics(self._lock)
+        self._graph: Optional[ImportGraph] = None
+        self._graph_roots: List[str] = []
 
     def __enter__(self) -> _PyImports:
         return cast(_PyImports, self)
@@ -60,6 +162,80 @@ class PyImports(UnUsedImportMixin):
 
         return True
 
+    @staticmethod
+    def shard_of(path: str, num_shards: int) -> int:
+        """Get the shard assigned to the path
+
+        The shard is computed with a stable hash of the path, so every node assigns
+        the files to the same shards without any coordination
+        Args:
+            path: path of the file relative to the directory scanned
+            num_shards: total of shards
+        """
+        normalized_path = os.path.normpath(path).replace(os.sep, "/")
+        return zlib.crc32(normalized_path.encode("utf-8")) % num_shards
+
+    @staticmethod
+    def decode_source(source: Union[str, bytes]) -> str:
+        """Decode the source code provided to text
+
+        The bytes are decoded with the encoding declared in the source (PEP 263
+        cookie or BOM), using utf-8 by default, in the same way the interpreter does
+        Args:
+            source: source code as text or raw bytes
+        """
+        if isinstance(source, str):
+            return source
+
+        encoding, _ = tokenize.detect_encoding(io.BytesIO(source).readline)
+        return source.decode(encoding)
+
+    @staticmethod
+    def strip_encoding_cookie(raw_content: str) -> str:
+        """Remove the encoding declaration of the first two lines, keeping the lines
+
+        The parser reads the declaration even in a text already decoded, so it must
+        be removed when it's not valid and the text was decoded with another encoding
+        """
+        lines = raw_content.split("\n", 2)
+        for index, line in enumerate(lines[:2]):
+            lines[index] = ENCODING_COOKIE.sub("#", line)
+        return "\n".join(lines)
+
+    @staticmethod
+    def get_ast_imports_from_source(
+        raw_content: str, plugins: Sequence[Type[AnalyzerPlugin]] = ()
+    ) -> ImportsCollectionFile:
+        """Parse python source code to get imports
+
+        Parse the source code with the ast library in order to get the imports
+        statement execute in it, the source code is parsed just once
+        Args:
+            raw_content: python source code to parse
+            plugins: classes of the plugins run in the same traversal
+        """
+        # Universal newlines, to split the lines in the same way that open() does
+        file_content = io.StringIO(raw_content, newline=None).readlines()
+        tree = ast.parse(raw_content)
+        analyzer = AstImportAnalyzer(
+            file_content, raw_content, [plugin() for plugin in plugins], tree
+        )
+        analyzer.visit(tree)
+
+        return analyzer.imports_metadata
+
+    @staticmethod
+    def get_token_imports_from_source(raw_content: str) -> ImportsCollectionFile:
+        """Recover the imports from python source code that can not be parsed
+        Args:
+            raw_content: python source code to recover the imports
+        """
+        file_content = io.StringIO(raw_content, newline=None).readlines()
+        analyzer = TokenImportAnalyzer(file_content, raw_content)
+        analyzer.analyze()
+
+        return analyzer.imports_metadata
+
     @staticmethod
     def get_ast_imports(path_file: str) -> ImportsCollectionFile:
         """Parse .py file to get imports
@@ -69,15 +245,96 @@ class PyImports(UnUsedImportMixin):
         Args:
             path_file: absolute path file to parse
         """
-        with open(path_file, "r", encoding="utf-8") as file:
-            file_content = file.readlines()
-            file.seek(0)
-            raw_content = file.read()
-            analyzer = AstImportAnalyzer(file_content, raw_content)
-            tree = ast.parse(raw_content)
-            analyzer.visit(tree)
+        with open(path_file, "rb") as file:
+            source = file.read()
 
-        return analyzer.imports_metadata
+        return PyImports.get_ast_imports_from_source(PyImports.decode_source(source))
+
+    def _register_imports(
+        self, name: str, file_imports: ImportsCollectionFile, keep: bool = True
+    ) -> None:
+        """Register the imports found in a source, replacing a previous scan of it
+        Args:
+            name: path of the file or name of the source
+            file_imports: imports found in the source
+            keep: If the imports are kept in the context, otherwise just the index and
+                the statistics are updated
+        """
+        with self._lock:
+            if keep:
+                self._imports.update({name: file_imports})
+            self._index.add(name, file_imports)
+            self._statistics.add(name, file_imports)
+            self._graph = None
+
+    def remove_imports(self, name: str) -> None:
+        """Remove from the context the imports and errors of a file, ex. deleted
+
+        The index, the statistics and the graph are updated too
+        Args:
+            name: path of the file or name of the source
+        """
+        with self._lock:
+            self._imports.pop(name, None)
+            self._errors.pop(name, None)
+            self._index.remove(name)
+            self._statistics.remove(name)
+            self._graph = None
+
+    def _clear_errors(self, name: str) -> None:
+        """Remove the errors of a previous scan of the source, before scanning it again"""
+        with self._lock:
+            self._errors.pop(name, None)
+
+    def _register_error(
+        self, name: str, error: BaseException, recovered: bool = False
+    ) -> None:
+        """Register an error found while the source was scanned"""
+        logger.warning("Error scanning %s: %s", name, error)
+        scan_error = ScanError.from_exception(name, error, recovered)
+        with self._lock:
+            self._errors.setdefault(name, []).append(scan_error)
+
+    def _parse_source(
+        self, name: str, source: Union[str, bytes]
+    ) -> ImportsCollectionFile:
+        """Parse the source code, according to the resilient mode
+        Args:
+            name: identifier of the source, used to register the errors found
+            source: python source code as text or raw bytes
+        """
+        if not self.resilient:
+            return self.get_ast_imports_from_source(
+                self.decode_source(source), self.plugins
+            )
+
+        try:
+            raw_content = self.decode_source(source)
+        except (SyntaxError, UnicodeDecodeError, LookupError) as error:
+            self._register_error(name, error, recovered=True)
+            raw_content = cast(bytes, source).decode("utf-8", errors="replace")
+            raw_content = self.strip_encoding_cookie(raw_content)
+
+        try:
+            return self.get_ast_imports_from_source(raw_content, self.plugins)
+        except (SyntaxError, ValueError, RecursionError) as error:
+            self._register_error(name, error, recovered=True)
+            return self.get_token_imports_from_source(raw_content)
+
+    def _read_source(self, path: str) -> Optional[bytes]:
+        """Read the raw content of the file
+
+        Returns:
+            The content of the file or None, if it can not be read in resilient mode
+        """
+        try:
+            with open(path, "rb") as file:
+                return file.read()
+        except OSError as error:
+            if not self.resilient:
+                raise
+            self._register_error(path, error)
+            return None
 
     def _process_py_files(
         self, files: List[str], root: str
@@ -95,7 +352,6 @@ class PyImports(UnUsedImportMixin):
             absolute_path = os.path.join(root, path_file)
             file_imports = self._process_file(absolute_path)
             imports_found.update({absolute_path: file_imports})
-            self._imports.update({absolute_path: file_imports})
         return imports_found
 
     def _process_file(self, path: str) -> ImportsCollectionFile:
@@ -107,37 +363,547 @@ class PyImports(UnUsedImportMixin):
             Dict: with the imports and from imports found
 
         """
-        file_imports = self.get_ast_imports(path)
-        self._imports.update({path: file_imports})
+        file_imports = self._scan_file(path)
+        if file_imports is None:
+            return ImportsCollectionFile()
+
+        self._register_imports(path, file_imports)
         return file_imports
 
-    def _process_dir(self, path_dir: str) -> Dict[str, ImportsCollectionFile]:
+    def _scan_file(self, path: str) -> Optional[ImportsCollectionFile]:
+        """Read and parse a .py file, without registering the imports
+        Args:
+            path: path of the .py file
+
+        Returns:
+            ImportsCollectionFile: the imports found, None if the file could not be read
+        """
+        self._clear_errors(path)
+        source = self._read_source(path)
+        if source is None:
+            return None
+        return self._parse_source(path, source)
+
+    def _walk_dir(
+        self, path_dir: str, shard: int = 0, num_shards: int = 1
+    ) -> Iterator[Tuple[str, List[str]]]:
+        """Get the files of every directory, just the files assigned to the shard
+        Args:
+            path_dir: absolute directory path
+            shard: shard to parse, just the files assigned to it are parsed
+            num_shards: total of shards the directory is split
+        """
+        for root, _, files in os.walk(path_dir):
+            if num_shards > 1:
+                relative_root = os.path.relpath(root, path_dir)
+                files = [
+                    file
+                    for file in files
+                    if self.shard_of(os.path.join(relative_root, file), num_shards)
+                    == shard
+                ]
+            yield root, files
+
+    def _process_dir(
+        self,
+        path_dir: str,
+        shard: int = 0,
+        num_shards: int = 1,
+        workers: Optional[int] = None,
+    ) -> Dict[str, ImportsCollectionFile]:
         """Parse every file found in the directory
         Args:
             path_dir: absolute directory path
+            shard: shard to parse, just the files assigned to it are parsed
+            num_shards: total of shards the directory is split
+            workers: amount of threads to parse the files, by default they are parsed
+                in the current thread
         """
         imports: Dict[str, ImportsCollectionFile] = {}
-        for root, _, files in os.walk(path_dir):
-            file_imports = self._process_py_files(files, root)
-            imports.update(file_imports)
-        return imports
+        if workers is None or workers <= 1:
+            for root, files in self._walk_dir(path_dir, shard, num_shards):
+                file_imports = self._process_py_files(files, root)
+                imports.update(file_imports)
+            return imports
+
+        paths = [
+            os.path.join(root, file)
+            for root, files in self._walk_dir(path_dir, shard, num_shards)
+            for file in files
+            if file.endswith(".py")
+        ]
+        return self._process_files(paths, workers)
+
+    def _process_files(
+        self, paths: Sequence[str], workers: Optional[int] = None
+    ) -> Dict[str, ImportsCollectionFile]:
+        """Parse every .py file provided
+        Args:
+            paths: paths of the .py files
+            workers: amount of threads to parse the files, by default they are parsed
+                in the current thread
+        """
+        if workers is None or workers <= 1:
+            return {path: self._process_file(path) for path in paths}
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(paths, executor.map(self._process_file, paths)))
+
+    def _scan_files_lazily(
+        self, paths: Iterable[str], workers: Optional[int] = None
+    ) -> Iterator[Tuple[str, Optional[ImportsCollectionFile]]]:
+        """Parse the files as the results are consumed
+
+        A new file is submitted to the pool of threads just when there are less than
+        2 * workers files parsed or waiting to be consumed, so the paths are pulled
+        and the results are produced at the pace of the consumer
+        Args:
+            paths: paths of the .py files, they are pulled lazily
+            workers: amount of threads to parse the files, by default they are parsed
+                in the current thread
+        """
+        if workers is None or workers <= 1:
+            for path in paths:
+                yield path, self._scan_file(path)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending: Dict[Future, str] = {}
+            for path in paths:
+                if len(pending) >= 2 * workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield pending.pop(future), future.result()
+                pending[executor.submit(self._scan_file, path)] = path
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+
+    @staticmethod
+    def check_shards(path: str, shard: Optional[int], num_shards: int) -> None:
+        """Validate the shard requested, raise WrongShardConfiguration if not valid"""
+        if num_shards < 1:
+            raise WrongShardConfiguration(
+                f"The total of shards must be at least 1, got {num_shards}"
+            )
+        if shard is None:
+            if num_shards > 1:
+                raise WrongShardConfiguration(
+                    f"A shard between 0 and {num_shards - 1} is required"
+                )
+            return
+        if not 0 <= shard < num_shards:
+            raise WrongShardConfiguration(
+                f"The shard must be between 0 and {num_shards - 1}, got {shard}"
+            )
+        if os.path.isfile(path):
+            raise WrongShardConfiguration("Just the directories can be split in shards")
 
     def get_imports(
-        self, path: str
+        self,
+        path: str,
+        shard: Optional[int] = None,
+        num_shards: int = 1,
+        workers: Optional[int] = None,
     ) -> Union[Dict[str, ImportsCollectionFile], ImportsCollectionFile, NoReturn]:
         """Get the imports in the context provided
 
+        Args:
+            path: path of the directory or file to parse
+            shard: if it's provided, in a directory are just parsed the files assigned
+                to the shard, see shard_of. It's required when the directory is split
+                in several shards and it's not allowed with a file
+            num_shards: total of shards the directory is split
+            workers: amount of threads to parse the files of a directory
+
         Returns:
             Dict: The imports found in the directory or files
         """
         imports: Union[Dict[str, ImportsCollectionFile], ImportsCollectionFile] = {}
+        self.check_shards(path, shard, num_shards)
+
         if self.is_valid(path):
             if os.path.isdir(path):
-                imports = self._process_dir(path)
+                imports = self._process_dir(path, shard or 0, num_shards, workers)
             else:
                 imports = self._process_file(path)
         return imports
 
+    def get_imports_bounded(
+        self,
+        path: str,
+        spill_path: str,
+        *,
+        max_results: int = 1000,
+        max_rss: Optional[int] = None,
+        workers: Optional[int] = None,
+        update_index: bool = False,
+    ) -> SpilledImports:
+        """Parse a directory or file with a bounded memory, spilling the results to disk
+
+        The results are buffered until there are max_results files or the resident
+        memory of the process exceeds max_rss, then they are appended to the spill file
+        (gzip JSON lines) and released. The files are parsed as the results are
+        buffered, so the results never queue faster than they are spilled
+        Args:
+            path: directory or .py file to parse
+            spill_path: path of the spill file, it's overwritten
+            max_results: max amount of results buffered in memory
+            max_rss: max resident memory of the process in bytes, None to not check it
+            workers: amount of threads to parse the files, by default they are parsed
+                in the current thread
+            update_index: If the index and the statistics are updated. They keep an
+                entry by file, so the memory grows with the corpus and max_rss can be
+                exceeded, by default they are not updated
+
+        Returns:
+            SpilledImports: the results, read lazily from the spill file
+
+        Notes:
+            The results are not kept in the context, see imports_resume and
+            errors_resume, the errors are spilled with the imports
+        """
+        if max_results < 1:
+            raise WrongMemoryConfiguration(
+                f"The max of results must be at least 1, got {max_results}"
+            )
+        if max_rss is not None and current_rss() is None:
+            raise WrongMemoryConfiguration(
+                "The resident memory can not be measured in this platform, "
+                "install psutil"
+            )
+
+        paths: Iterable[str] = [path]
+        if os.path.isdir(path):
+            paths = (
+                os.path.join(root, file)
+                for root, files in self._walk_dir(path)
+                for file in files
+                if file.endswith(".py")
+            )
+        else:
+            self.is_valid(path)
+
+        buffer: List[SpillRecord] = []
+        with SpillWriter(spill_path) as writer:
+            for file_path, file_imports in self._scan_files_lazily(paths, workers):
+                with self._lock:
+                    errors = self._errors.pop(file_path, [])
+                if file_imports is not None and update_index:
+                    self._register_imports(file_path, file_imports, keep=False)
+                buffer.append((file_path, file_imports, errors))
+
+                if len(buffer) >= max_results or (
+                    max_rss is not None and (current_rss() or 0) > max_rss
+                ):
+                    writer.write(buffer)
+                    buffer.clear()
+            writer.write(buffer)
+        return SpilledImports(spill_path, writer.results)
+
+    def get_imports_from_source(
+        self, source: Union[str, bytes], name: str = "<unknown>"
+    ) -> ImportsCollectionFile:
+        """Get the imports in source code already loaded in memory
+
+        Nothing is read from the disk, useful to analyze unsaved buffers
+        Args:
+            source: python source code as text or raw bytes
+            name: identifier used to register the result, ex. the file path
+
+        Returns:
+            ImportsCollectionFile: The imports found in the source code
+        """
+        self._clear_errors(name)
+        file_imports = self._parse_source(name, source)
+        self._register_imports(name, file_imports)
+        return file_imports
+
+    def get_imports_from_sources(
+        self, sources: Iterable[Tuple[str, Union[str, bytes]]]
+    ) -> Dict[str, ImportsCollectionFile]:
+        """Get the imports in a batch of sources already loaded in memory
+        Args:
+            sources: pairs of (name, source code) to parse
+
+        Returns:
+            Dict: The imports found in each source by name
+        """
+        imports: Dict[str, ImportsCollectionFile] = {}
+        for name, source in sources:
+            imports.update({name: self.get_imports_from_source(source, name)})
+        return imports
+
     def imports_resume(self) -> Dict[str, ImportsCollectionFile]:
         """Get all the imports parsed in the context"""
-        return self._imports
+        with self._lock:
+            return dict(self._imports)
+
+    @property
+    def index(self) -> ImportsIndex:
+        """Reverse index of the imports parsed in the context, see ImportsIndex
+
+        Notes:
+            The index shares the lock of the manager, it can be queried while the
+            files are parsed in other threads
+        """
+        return self._index
+
+    @property
+    def statistics(self) -> ImportStatistics:
+        """Statistics of the imports parsed in the context, see ImportStatistics
+
+        Notes:
+            The counters are updated while the files are parsed, the statistics share
+            the lock of the manager, they can be queried while the files are parsed in
+            other threads
+        """
+        return self._statistics
+
+    def files_importing(self, name: str) -> List[str]:
+        """Get the files parsed in the context where the module or name is imported
+
+        Args:
+            name: dotted name, ex. "requests.Session" or a prefix like "django.db.*"
+        """
+        with self._lock:
+            return self._index.files_importing(name)
+
+    def import_graph(self, roots: Optional[Sequence[str]] = None) -> ImportGraph:
+        """Get the graph of dependencies between the modules parsed in the context
+
+        The graph is cached until a new file is parsed or loaded in the context
+        Args:
+            roots: source directories, the module names are relative to them
+        """
+        roots = list(roots or [])
+        with self._lock:
+            if self._graph is None or self._graph_roots != roots:
+                self._graph = ImportGraph(self._imports, roots)
+                self._graph_roots = roots
+            return self._graph
+
+    def affected_by(
+        self, changed_files: Iterable[str], roots: Optional[Sequence[str]] = None
+    ) -> ImpactReport:
+        """Get the modules and test files affected by the files changed
+
+        Args:
+            changed_files: paths of the files modified, added or removed
+            roots: source directories, the module names are relative to them
+
+        Returns:
+            ImpactReport: modules, files and test files affected
+        """
+        return self.import_graph(roots).affected_by(changed_files)
+
+    def check_import_budgets(
+        self,
+        budgets: Iterable[ImportBudget],
+        roots: Optional[Sequence[str]] = None,
+        raise_error: bool = True,
+    ) -> List[BudgetViolation]:
+        """Check the modules loaded at import time by the entry points
+
+        Args:
+            budgets: budget of every entry point, see ImportBudget
+            roots: source directories, the module names are relative to them
+            raise_error: raise ImportBudgetExceeded if some budget is exceeded
+
+        Returns:
+            List: the violations of the budgets
+        """
+        checker = ImportBudgetChecker(self.import_graph(roots))
+        violations = checker.check_all(budgets)
+        if violations and raise_error:
+            raise ImportBudgetExceeded(violations)
+        return violations
+
+    def requirements_audit(
+        self,
+        requirements_files: Sequence[str],
+        first_party: Optional[Iterable[str]] = None,
+        roots: Optional[Sequence[str]] = None,
+        include_dev: bool = False,
+    ) -> RequirementsReport:
+        """Audit the third party imports against the requirements declared
+
+        The top level modules imported are mapped to the distributions installed
+        in the environment, to get the distributions undeclared, unused and imported
+        just in inner scopes
+        Args:
+            requirements_files: paths of pyproject.toml or requirements files
+            first_party: top level modules of the project, by default the top level
+                modules parsed in the context, see import_graph
+            roots: source directories, used to get the top level modules parsed
+            include_dev: If the development requirements of the pyproject.toml (dev
+                dependencies and groups) are audited, by default just the runtime
+                requirements are audited, the test and lint tools are never imported
+        """
+        declared: Set[str] = set()
+        for requirements_file in requirements_files:
+            declared |= parse_requirements_file(requirements_file, include_dev)
+
+        if first_party is None:
+            modules = self.import_graph(roots).modules
+            first_party = {module.split(".")[0] for module in modules}
+
+        audit = RequirementsAudit(self.imports_resume(), first_party)
+        return audit.audit(declared)
+
+    def fix_unused_imports(
+        self,
+        path: str,
+        dry_run: bool = False,
+        workers: Optional[int] = None,
+        include_init: bool = False,
+    ) -> List[FixResult]:
+        """Remove the unused imports in a directory or file
+
+        The files are fixed in parallel processes and just the files with changes are
+        written, atomically
+        Args:
+            path: path of the directory or file to fix
+            dry_run: just get the diffs, without writing the files
+            workers: amount of processes, by default the amount of CPUs
+            include_init: fix the __init__.py files too, by default they are skipped
+                because the imports there are usually re-exported
+
+        Returns:
+            List: the result of every file with changes or errors
+        """
+        paths: List[str] = [path]
+        if self.is_valid(path) and os.path.isdir(path):
+            paths = [
+                os.path.join(root, file)
+                for root, _, files in os.walk(path)
+                for file in files
+                if file.endswith(".py") and (include_init or file != "__init__.py")
+            ]
+
+        results = fix_files(paths, dry_run, workers)
+        return [result for result in results if result.changed or result.error]
+
+    def errors_resume(self) -> Dict[str, List[ScanError]]:
+        """Get all the errors found in the context by path, in resilient mode"""
+        with self._lock:
+            return {path: list(errors) for path, errors in self._errors.items()}
+
+    def dump(self, artifact_path: str, **metadata: Any) -> None:
+        """Save the imports and errors parsed in the context in a JSON artifact
+
+        The artifact is self-contained, it can be merged in another context with load
+        Args:
+            artifact_path: path of the file to save the artifact
+            **metadata: Extra JSON serializable data saved in the artifact, ex. shard
+        """
+        artifact = {
+            "format": ARTIFACT_FORMAT,
+            "version": ARTIFACT_VERSION,
+            "metadata": metadata,
+            "files": {
+                path: imports.to_dict() for path, imports in self.imports_resume().items()
+            },
+            "errors": {
+                path: [error.to_dict() for error in errors]
+                for path, errors in self.errors_resume().items()
+            },
+        }
+        with open(artifact_path, "w", encoding="utf-8") as file:
+            json.dump(artifact, file)
+
+    def load(self, *artifact_paths: str) -> Dict[str, ImportsCollectionFile]:
+        """Merge in the context the imports and errors saved in the artifacts
+
+        Args:
+            *artifact_paths: paths of the artifacts generated with dump
+
+        Returns:
+            Dict: The imports loaded from the artifacts
+        """
+        imports: Dict[str, ImportsCollectionFile] = {}
+        for artifact_path in artifact_paths:
+            with open(artifact_path, "r", encoding="utf-8") as file:
+                artifact = json.load(file)
+
+            if (
+                not isinstance(artifact, dict)
+                or artifact.get("format") != ARTIFACT_FORMAT
+                or artifact.get("version") != ARTIFACT_VERSION
+            ):
+                raise WrongArtifactFormat(
+                    f"{artifact_path} is not a valid py_imports artifact, "
+                    f"version {ARTIFACT_VERSION} expected"
+                )
+
+            for path, data in artifact["files"].items():
+                file_imports = ImportsCollectionFile.from_dict(data)
+                self._register_imports(path, file_imports)
+                imports.update({path: file_imports})
+            for path, errors in artifact["errors"].items():
+                with self._lock:
+                    self._errors[path] = [ScanError.from_dict(error) for error in errors]
+        return imports
+
+    def get_environment_imports(
+        self,
+        cache_dir: str,
+        path: Optional[List[str]] = None,
+        workers: Optional[int] = None,
+    ) -> Dict[str, ImportsCollectionFile]:
+        """Get the imports of every distribution installed in the environment
+
+        The files are grouped by distribution with the files installed (RECORD). The
+        imports of every distribution are cached in an artifact (see dump) named with
+        its name, location, version and the hash of the RECORD, so in a new scan just
+        the distributions installed or upgraded since the last one are parsed, and
+        several environments can share the cache directory
+        Args:
+            cache_dir: directory of the artifacts of the distributions
+            path: directories where the distributions are installed, sys.path by default
+            workers: amount of threads to parse the files of a distribution
+
+        Returns:
+            Dict: The imports of the files of every distribution
+
+        Notes:
+            The distributions are parsed in resilient mode, the files that can not be
+            parsed are registered in errors_resume
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        cached = cache_paths(cache_dir)
+        # The results of the plugins are cached too
+        plugins = [f"{plugin.__module__}.{plugin.__name__}" for plugin in self.plugins]
+
+        imports: Dict[str, ImportsCollectionFile] = {}
+        for distribution in installed_distributions(path):
+            cache_key = distribution_cache_key(distribution, plugins)
+            if cache_key in cached:
+                try:
+                    imports.update(self.load(cached[cache_key]))
+                    continue
+                except (ValueError, KeyError, WrongArtifactFormat) as error:
+                    logger.warning("Invalid cache %s: %s", cached[cache_key], error)
+
+            scanner = PyImports(resilient=True, plugins=self.plugins)
+            files = distribution_py_files(distribution)
+            scanner._process_files(files, workers)  # pylint: disable=W0212
+            # The artifact is renamed when it's complete, so a scan interrupted never
+            # leaves a partial cache
+            descriptor, temporal_path = tempfile.mkstemp(
+                dir=cache_dir, prefix=f".{cache_key}.", suffix=".tmp"
+            )
+            os.close(descriptor)
+            scanner.dump(
+                temporal_path,
+                distribution=distribution.metadata["Name"],
+                version=distribution.version,
+            )
+            cache_path = os.path.join(cache_dir, f"{cache_key}.json")
+            os.replace(temporal_path, cache_path)
+            prune_cache(cache_dir, cache_key)
+            logger.debug("%s parsed and cached in %s", cache_key, cache_path)
+            imports.update(self.load(cache_path))
+        return imports
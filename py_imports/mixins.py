@@ -1,7 +1,7 @@
 """Mixins"""
 import ast
 import textwrap
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from pyflakes import checker
 from pyflakes.messages import UnusedImport
@@ -14,22 +14,39 @@ class UnUsedImportMixin:
 
     raw_content: str
 
-    def get_unused_import(self) -> Dict:
+    def get_unused_import_alerts(
+        self, tree: Optional[ast.AST] = None
+    ) -> List[UnusedImport]:
+        """
+        Get the pyflakes alerts about imports not used
+
+        Args:
+            tree: ast of the raw content, if it was already parsed
+
+        Notes:
+            The argument of every alert is the binding imported as pyflakes
+            describe it, ex. "numpy as np", "os.path", ".module.foo"
+        """
+        tree = tree if tree is not None else ast.parse(self.raw_content)
+        file_tokens = checker.make_tokens(textwrap.dedent(self.raw_content))
+        analysis_result = checker.Checker(tree, file_tokens=file_tokens)
+        return [
+            alert for alert in analysis_result.messages if isinstance(alert, UnusedImport)
+        ]
+
+    def get_unused_import(self, tree: Optional[ast.AST] = None) -> Dict:
         """
         Get modules of packages not used but was imported
 
+        Args:
+            tree: ast of the raw content, if it was already parsed
+
         Returns:
             Dict of the packages/modules not used in the file by line index
         """
         unused: Dict[int, List] = {}
-        tree = ast.parse(self.raw_content)
-        file_tokens = checker.make_tokens(textwrap.dedent(self.raw_content))
-        analysis_result = checker.Checker(tree, file_tokens=file_tokens)
-
-        for alert in analysis_result.messages:
-            if not isinstance(alert, UnusedImport):
-                continue
 
+        for alert in self.get_unused_import_alerts(tree):
             alert_messages = [msg.split(".")[-1] for msg in alert.message_args]
             if alert.lineno in unused:
                 unused[alert.lineno].append(*alert_messages)
@@ -0,0 +1,189 @@
+"""Plugins to run custom analyses while the imports are parsed"""
+import ast
+import sys
+from typing import Any, Callable, Dict, List, Optional, Type
+
+
+# will be disable invalid-name alert in this module, because the handlers follow
+# the names of the ast nodes, like the builtin ast.NodeVisitor
+# pylint: disable=C0103
+
+Handler = Callable[[Any], None]
+
+
+class AnalyzerPlugin:
+    """
+    Base class of the plugins run by AstImportAnalyzer in the same traversal of the ast
+
+    A new instance is created for every file parsed. The nodes are handled by the
+    methods named "visit_" + the class name of the node, like in ast.NodeVisitor, and
+    the result of the plugin is attached to the ImportsCollectionFile of the file
+
+    Examples:
+        class CallsCounter(AnalyzerPlugin):
+            name = "calls"
+
+            def __init__(self) -> None:
+                self.calls = 0
+
+            def visit_Call(self, node: ast.Call) -> None:
+                self.calls += 1
+
+            def result(self) -> int:
+                return self.calls
+    """
+
+    # Key of the result in ImportsCollectionFile.plugins_data
+    name: str = ""
+
+    def handlers(self) -> Dict[Type[ast.AST], Handler]:
+        """Get the handler of every type of node handled by the plugin"""
+        handlers: Dict[Type[ast.AST], Handler] = {}
+        for attribute in dir(self):
+            if not attribute.startswith("visit_"):
+                continue
+            node_type = getattr(ast, attribute[len("visit_") :], None)  # noqa: E203
+            if isinstance(node_type, type) and issubclass(node_type, ast.AST):
+                handlers[node_type] = getattr(self, attribute)
+        return handlers
+
+    def result(self) -> Any:
+        """Get the result of the analysis, it should be JSON serializable"""
+        raise NotImplementedError
+
+
+def _dotted_name(node: ast.AST) -> Optional[str]:
+    """Get the dotted name of a name or attribute node, ex. importlib.import_module"""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        value = _dotted_name(node.value)
+        return f"{value}.{node.attr}" if value else None
+    return None
+
+
+def _literal_string(node: Optional[ast.AST]) -> Optional[str]:
+    """Get the value of a literal string node, None if it's not a literal string"""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    # In python 3.7 the literal strings are parsed as ast.Str
+    if sys.version_info < (3, 8) and isinstance(node, ast.Str):
+        return node.s
+    return None
+
+
+class DynamicImportsPlugin(AnalyzerPlugin):
+    """
+    Capture the modules imported dynamically
+
+    Examples:
+        importlib.import_module("pkg.module")
+        __import__("module")
+    """
+
+    name = "dynamic_imports"
+
+    FUNCTIONS = {"importlib.import_module", "import_module", "__import__"}
+
+    def __init__(self) -> None:
+        self.imports: List[Dict[str, Any]] = []
+
+    def visit_Call(self, node: ast.Call) -> None:
+        """Capture the calls to the functions that import modules"""
+        function = _dotted_name(node.func)
+        if function not in self.FUNCTIONS:
+            return
+
+        argument = node.args[0] if node.args else None
+        self.imports.append(
+            {
+                "line": node.lineno,
+                "function": function,
+                # The module is unknown when it's not a literal string
+                "module": _literal_string(argument),
+            }
+        )
+
+    def result(self) -> List[Dict[str, Any]]:
+        return self.imports
+
+
+class DunderAllPlugin(AnalyzerPlugin):
+    """
+    Capture the names declared in __all__ in the global scope
+
+    Examples:
+        __all__ = ["foo", "bar"]
+        __all__ += ["baz"]
+    """
+
+    name = "dunder_all"
+
+    def __init__(self) -> None:
+        self.names: Optional[List[str]] = None
+
+    def _capture(self, value: ast.AST) -> None:
+        """Capture the literal strings of the list or tuple assigned"""
+        if not isinstance(value, (ast.List, ast.Tuple)):
+            return
+        names = map(_literal_string, value.elts)
+        self.names = (self.names or []) + [name for name in names if name is not None]
+
+    @staticmethod
+    def in_global_scope(node: ast.AST) -> bool:
+        """Validate if the node is in the global scope, see AstImportAnalyzer.visit"""
+        return isinstance(getattr(node, "parent", None), ast.Module)
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        """Capture __all__ = [...]"""
+        if self.in_global_scope(node) and any(
+            _dotted_name(target) == "__all__" for target in node.targets
+        ):
+            self.names = None
+            self._capture(node.value)
+
+    def visit_AugAssign(self, node: ast.AugAssign) -> None:
+        """Capture __all__ += [...]"""
+        if self.in_global_scope(node) and _dotted_name(node.target) == "__all__":
+            self._capture(node.value)
+
+    def result(self) -> Optional[List[str]]:
+        return self.names
+
+
+class SysPathPlugin(AnalyzerPlugin):
+    """
+    Capture the mutations of sys.path
+
+    Examples:
+        sys.path.insert(0, "lib")
+        sys.path = ["lib"]
+    """
+
+    name = "sys_path"
+
+    METHODS = {"append", "insert", "extend", "remove", "pop", "clear"}
+
+    def __init__(self) -> None:
+        self.mutations: List[Dict[str, Any]] = []
+
+    def visit_Call(self, node: ast.Call) -> None:
+        """Capture sys.path.<method>(...)"""
+        function = _dotted_name(node.func)
+        if function and function.startswith("sys.path."):
+            operation = function[len("sys.path.") :]  # noqa: E203
+            if operation in self.METHODS:
+                self.mutations.append({"line": node.lineno, "operation": operation})
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        """Capture sys.path = ..."""
+        if any(_dotted_name(target) == "sys.path" for target in node.targets):
+            self.mutations.append({"line": node.lineno, "operation": "assign"})
+
+    def visit_AugAssign(self, node: ast.AugAssign) -> None:
+        """Capture sys.path += ..."""
+        if _dotted_name(node.target) == "sys.path":
+            self.mutations.append({"line": node.lineno, "operation": "extend"})
+
+    def result(self) -> List[Dict[str, Any]]:
+        return self.mutations
@@ -0,0 +1,592 @@
+"""Audit of the third party requirements imported"""
+
+import functools
+import os
+import re
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from py_imports.base.models import ImportsCollectionFile, ImportStatement
+from py_imports.exceptions import UnsupportedPythonVersion, UnsupportedRequirementsFile
+
+
+try:  # pragma: no cover
+    from importlib import metadata as importlib_metadata
+except ImportError:  # pragma: no cover
+    # python 3.7, importlib-metadata is a dependency for this version
+    try:
+        import importlib_metadata  # type: ignore
+    except ImportError:
+        importlib_metadata = None  # type: ignore
+
+try:  # pragma: no cover
+    import tomllib  # type: ignore
+except ImportError:  # pragma: no cover
+    # python < 3.11, tomli is a dependency for these versions
+    try:
+        import tomli as tomllib  # type: ignore
+    except ImportError:
+        tomllib = None  # type: ignore
+
+
+# Top level modules of the standard library, for the versions without
+# sys.stdlib_module_names (python < 3.10), including the modules already removed
+STDLIB_MODULES = frozenset(
+    getattr(sys, "stdlib_module_names", ())
+    or (
+        "__future__",
+        "__main__",
+        "abc",
+        "aifc",
+        "antigravity",
+        "argparse",
+        "array",
+        "ast",
+        "asynchat",
+        "asyncio",
+        "asyncore",
+        "atexit",
+        "audioop",
+        "base64",
+        "bdb",
+        "binascii",
+        "binhex",
+        "bisect",
+        "builtins",
+        "bz2",
+        "cProfile",
+        "calendar",
+        "cgi",
+        "cgitb",
+        "chunk",
+        "cmath",
+        "cmd",
+        "code",
+        "codecs",
+        "codeop",
+        "collections",
+        "colorsys",
+        "compileall",
+        "concurrent",
+        "configparser",
+        "contextlib",
+        "contextvars",
+        "copy",
+        "copyreg",
+        "crypt",
+        "csv",
+        "ctypes",
+        "curses",
+        "dataclasses",
+        "datetime",
+        "dbm",
+        "decimal",
+        "difflib",
+        "dis",
+        "distutils",
+        "doctest",
+        "dummy_threading",
+        "email",
+        "encodings",
+        "ensurepip",
+        "enum",
+        "errno",
+        "faulthandler",
+        "fcntl",
+        "filecmp",
+        "fileinput",
+        "fnmatch",
+        "formatter",
+        "fractions",
+        "ftplib",
+        "functools",
+        "gc",
+        "genericpath",
+        "getopt",
+        "getpass",
+        "gettext",
+        "glob",
+        "graphlib",
+        "grp",
+        "gzip",
+        "hashlib",
+        "heapq",
+        "hmac",
+        "html",
+        "http",
+        "idlelib",
+        "imaplib",
+        "imghdr",
+        "imp",
+        "importlib",
+        "inspect",
+        "io",
+        "ipaddress",
+        "itertools",
+        "json",
+        "keyword",
+        "lib2to3",
+        "linecache",
+        "locale",
+        "logging",
+        "lzma",
+        "macpath",
+        "mailbox",
+        "mailcap",
+        "marshal",
+        "math",
+        "mimetypes",
+        "mmap",
+        "modulefinder",
+        "msilib",
+        "msvcrt",
+        "multiprocessing",
+        "netrc",
+        "nis",
+        "nntplib",
+        "nt",
+        "ntpath",
+        "nturl2path",
+        "numbers",
+        "opcode",
+        "operator",
+        "optparse",
+        "os",
+        "ossaudiodev",
+        "parser",
+        "pathlib",
+        "pdb",
+        "pickle",
+        "pickletools",
+        "pipes",
+        "pkgutil",
+        "platform",
+        "plistlib",
+        "poplib",
+        "posix",
+        "posixpath",
+        "pprint",
+        "profile",
+        "pstats",
+        "pty",
+        "pwd",
+        "py_compile",
+        "pyclbr",
+        "pydoc",
+        "pydoc_data",
+        "pyexpat",
+        "queue",
+        "quopri",
+        "random",
+        "re",
+        "readline",
+        "reprlib",
+        "resource",
+        "rlcompleter",
+        "runpy",
+        "sched",
+        "secrets",
+        "select",
+        "selectors",
+        "shelve",
+        "shlex",
+        "shutil",
+        "signal",
+        "site",
+        "smtpd",
+        "smtplib",
+        "sndhdr",
+        "socket",
+        "socketserver",
+        "spwd",
+        "sqlite3",
+        "sre_compile",
+        "sre_constants",
+        "sre_parse",
+        "ssl",
+        "stat",
+        "statistics",
+        "string",
+        "stringprep",
+        "struct",
+        "subprocess",
+        "sunau",
+        "symbol",
+        "symtable",
+        "sys",
+        "sysconfig",
+        "syslog",
+        "tabnanny",
+        "tarfile",
+        "telnetlib",
+        "tempfile",
+        "termios",
+        "textwrap",
+        "this",
+        "threading",
+        "time",
+        "timeit",
+        "tkinter",
+        "token",
+        "tokenize",
+        "tomllib",
+        "trace",
+        "traceback",
+        "tracemalloc",
+        "tty",
+        "turtle",
+        "turtledemo",
+        "types",
+        "typing",
+        "unicodedata",
+        "unittest",
+        "urllib",
+        "uu",
+        "uuid",
+        "venv",
+        "warnings",
+        "wave",
+        "weakref",
+        "webbrowser",
+        "winreg",
+        "winsound",
+        "wsgiref",
+        "xdrlib",
+        "xml",
+        "xmlrpc",
+        "zipapp",
+        "zipfile",
+        "zipimport",
+        "zlib",
+        "zoneinfo",
+    )
+) | frozenset(sys.builtin_module_names)
+
+
+def canonical_name(name: str) -> str:
+    """Normalize the name of a distribution (PEP 503)
+
+    Examples:
+        Flask_SQLAlchemy -> flask-sqlalchemy
+    """
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def check_metadata_support() -> None:
+    """Validate if the metadata of the distributions installed can be read
+
+    Raises:
+        UnsupportedPythonVersion: If importlib.metadata is not available, python 3.7
+            without the package importlib-metadata
+    """
+    if importlib_metadata is None:
+        raise UnsupportedPythonVersion(
+            "It's required python 3.8+ or the package importlib-metadata to read the "
+            "distributions installed"
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def _packages_distributions(path: Tuple[str, ...]) -> Dict[str, Tuple[str, ...]]:
+    """Map the top level modules to the distributions installed in the path
+
+    Notes:
+        The path is part of the cache key, so the distributions are read once per
+        environment
+    """
+    check_metadata_support()
+
+    packages: Dict[str, Set[str]] = {}
+    for distribution in importlib_metadata.distributions(path=list(path)):
+        name = distribution.metadata["Name"]
+        if not name:
+            continue
+
+        top_level = distribution.read_text("top_level.txt")
+        if top_level:
+            modules = {module.strip() for module in top_level.split() if module.strip()}
+        else:
+            modules = set()
+            for file in distribution.files or []:
+                if file.parts[0].startswith("..") or file.parts[0].endswith(
+                    (".dist-info", ".egg-info", ".data")
+                ):
+                    continue
+                if len(file.parts) > 1 and file.suffix == ".py":
+                    modules.add(file.parts[0])
+                elif file.suffix in (".py", ".so", ".pyd"):
+                    modules.add(file.name.split(".")[0])
+
+        for module in modules:
+            packages.setdefault(module, set()).add(canonical_name(name))
+
+    return {module: tuple(sorted(names)) for module, names in packages.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def _namespace_distributions(path: Tuple[str, ...]) -> Dict[str, Tuple[str, ...]]:
+    """Map the modules of the top level modules shared by several distributions
+    (namespace packages) to the distributions that install them
+
+    Examples:
+        {"google.protobuf": ("protobuf",), "google.auth": ("google-auth",)}
+    """
+    shared = {
+        module
+        for module, names in _packages_distributions(path).items()
+        if len(names) > 1
+    }
+    if not shared:
+        return {}
+
+    modules: Dict[str, Set[str]] = {}
+    for distribution in importlib_metadata.distributions(path=list(path)):
+        name = distribution.metadata["Name"]
+        if not name:
+            continue
+        for file in distribution.files or []:
+            if file.parts[0] not in shared or file.suffix not in (".py", ".so", ".pyd"):
+                continue
+            parts = [*file.parts[:-1], file.name.split(".")[0]]
+            if parts[-1] == "__init__":
+                parts.pop()
+            for end in range(2, len(parts) + 1):
+                modules.setdefault(".".join(parts[:end]), set()).add(canonical_name(name))
+
+    return {module: tuple(sorted(names)) for module, names in modules.items()}
+
+
+def packages_distributions(
+    path: Optional[List[str]] = None,
+) -> Dict[str, Tuple[str, ...]]:
+    """Map the top level modules to the distributions installed that provide them
+
+    Args:
+        path: directories where the distributions are installed, sys.path by default
+
+    Examples:
+        {"yaml": ("pyyaml",), "flask": ("flask",)}
+
+    Raises:
+        UnsupportedPythonVersion: If importlib.metadata is not available
+    """
+    return _packages_distributions(tuple(sys.path if path is None else path))
+
+
+def _requirement_name(requirement: str) -> Optional[str]:
+    """Get the name of the distribution in a requirement (PEP 508)"""
+    match = re.match(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)", requirement)
+    return canonical_name(match.group(1)) if match else None
+
+
+def parse_requirements_txt(path: str) -> Set[str]:
+    """Get the distributions declared in a requirements file, like requirements.txt
+
+    Notes:
+        The files included with "-r" are parsed too, the other options are ignored
+    """
+    declared: Set[str] = set()
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            line = line.split(" #")[0].strip()
+            if line.startswith(("-r ", "--requirement ")):
+                included = line.split(maxsplit=1)[1]
+                declared |= parse_requirements_txt(
+                    os.path.join(os.path.dirname(path), included)
+                )
+                continue
+            if not line or line.startswith(("#", "-")):
+                continue
+            name = _requirement_name(line)
+            if name:
+                declared.add(name)
+    return declared
+
+
+def parse_pyproject(path: str, include_dev: bool = False) -> Set[str]:
+    """Get the distributions declared in a pyproject.toml
+
+    Args:
+        path: path of the pyproject.toml
+        include_dev: If the development requirements are included, the poetry dev
+            dependencies and groups, and the PEP 735 dependency groups
+
+    Notes:
+        It's supported the PEP 621 [project] table and the [tool.poetry] table. The
+        optional dependencies (extras) are runtime requirements
+
+    Raises:
+        UnsupportedRequirementsFile: If there is not a TOML parser available
+    """
+    if tomllib is None:
+        raise UnsupportedRequirementsFile(
+            "It's required python 3.11+ or the package tomli to parse pyproject.toml"
+        )
+
+    with open(path, "rb") as file:
+        pyproject = tomllib.load(file)
+
+    requirements: List[str] = []
+    project = pyproject.get("project", {})
+    requirements.extend(project.get("dependencies", []))
+    for optional in project.get("optional-dependencies", {}).values():
+        requirements.extend(optional)
+
+    poetry = pyproject.get("tool", {}).get("poetry", {})
+    tables: List[Dict[str, Any]] = [poetry.get("dependencies", {})]
+    if include_dev:
+        tables.append(poetry.get("dev-dependencies", {}))
+        tables.extend(
+            group.get("dependencies", {}) for group in poetry.get("group", {}).values()
+        )
+        for group in pyproject.get("dependency-groups", {}).values():
+            # The groups can include other groups, ex. {include-group = "test"}
+            requirements.extend(item for item in group if isinstance(item, str))
+    for table in tables:
+        requirements.extend(name for name in table if name.lower() != "python")
+
+    return {name for name in map(_requirement_name, requirements) if name}
+
+
+def parse_requirements_file(path: str, include_dev: bool = False) -> Set[str]:
+    """Get the distributions declared in a pyproject.toml or requirements file
+
+    Args:
+        path: path of the pyproject.toml or requirements file
+        include_dev: If the development requirements of the pyproject.toml are
+            included, a requirements file is always parsed entirely
+    """
+    if os.path.basename(path) == "pyproject.toml":
+        return parse_pyproject(path, include_dev)
+    return parse_requirements_txt(path)
+
+
+class RequirementsReport:
+    """
+    Class to collect the result of the audit of the requirements
+    """
+
+    def __init__(
+        self,
+        *,
+        distributions: Dict[str, Set[str]],
+        stdlib: Set[str],
+        unresolved: Set[str],
+        undeclared: Set[str],
+        unused: Set[str],
+        inner_scope_only: Set[str],
+    ) -> None:
+        """Initialize the report
+        Args:
+            distributions: Distributions imported with the top level modules imported
+            stdlib: Modules of the standard library imported
+            unresolved: Modules imported that are not local, stdlib or installed
+            undeclared: Distributions imported but not declared as requirement
+            unused: Distributions declared as requirement but never imported
+            inner_scope_only: Distributions imported just in inner scopes
+        """
+        self.distributions = distributions
+        self.stdlib = sorted(stdlib)
+        self.unresolved = sorted(unresolved)
+        self.undeclared = sorted(undeclared)
+        self.unused = sorted(unused)
+        self.inner_scope_only = sorted(inner_scope_only)
+
+
+class RequirementsAudit:
+    """
+    Map the absolute imports to the distributions installed and compare them with
+    the requirements declared
+    """
+
+    def __init__(
+        self,
+        imports: Dict[str, ImportsCollectionFile],
+        first_party: Iterable[str] = (),
+        path: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Args:
+            imports: imports parsed by path, ex. PyImports.imports_resume()
+            first_party: top level modules of the project, they are not requirements
+            path: directories where the distributions are installed, sys.path by default
+        """
+        self.imports = imports
+        self.first_party = set(first_party)
+        self.path = path
+
+    @staticmethod
+    def imported_modules(
+        collection: ImportsCollectionFile,
+    ) -> Iterable[Tuple[str, ImportStatement]]:
+        """Get the modules imported with absolute imports, the names imported from a
+        module are included because they can be submodules, ex. "google.protobuf"
+        """
+        for statement in collection.imports:
+            for child in statement.children:
+                yield child, statement
+        for absolute_import in collection.absolute_imports:
+            if absolute_import.parent:
+                for child in absolute_import.children:
+                    yield f"{absolute_import.parent}.{child}", absolute_import
+
+    @staticmethod
+    def resolve(
+        module: str,
+        packages: Dict[str, Tuple[str, ...]],
+        namespaces: Dict[str, Tuple[str, ...]],
+    ) -> Tuple[str, ...]:
+        """Get the distributions that provide the module
+
+        Notes:
+            When the top level module is shared by several distributions, ex. the
+            namespace package "google", the longest module installed that contains
+            the module decides the distributions
+        """
+        parts = module.split(".")
+        for end in range(len(parts), 1, -1):
+            distributions = namespaces.get(".".join(parts[:end]))
+            if distributions:
+                return distributions
+        return packages[parts[0]]
+
+    def audit(self, declared: Iterable[str]) -> RequirementsReport:
+        """Audit the imports against the requirements declared
+
+        Args:
+            declared: names of the distributions declared as requirement
+        """
+        declared_names = {canonical_name(name) for name in declared}
+        packages = packages_distributions(self.path)
+        namespaces = _namespace_distributions(
+            tuple(sys.path if self.path is None else self.path)
+        )
+
+        distributions: Dict[str, Set[str]] = {}
+        stdlib: Set[str] = set()
+        unresolved: Set[str] = set()
+        outer_scope: Set[str] = set()
+        for collection in self.imports.values():
+            for module, statement in self.imported_modules(collection):
+                root = module.split(".")[0]
+                if root in self.first_party:
+                    continue
+                if root in STDLIB_MODULES:
+                    stdlib.add(root)
+                    continue
+                if root not in packages:
+                    unresolved.add(root)
+                    continue
+                for distribution in self.resolve(module, packages, namespaces):
+                    distributions.setdefault(distribution, set()).add(root)
+                    if not statement.in_inner_scope:
+                        outer_scope.add(distribution)
+
+        return RequirementsReport(
+            distributions=distributions,
+            stdlib=stdlib,
+            unresolved=unresolved,
+            undeclared=set(distributions) - declared_names,
+            unused=declared_names - set(distributions),
+            inner_scope_only=set(distributions) - outer_scope,
+        )
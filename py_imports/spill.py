@@ -0,0 +1,120 @@
+"""Spill the imports parsed to disk, to scan with a bounded memory"""
+import gzip
+import json
+import os
+from types import TracebackType
+from typing import IO, Iterator, List, Optional, Tuple, Type
+
+from py_imports.base.models import ImportsCollectionFile, ScanError
+
+
+try:
+    import psutil  # type: ignore
+except ImportError:  # pragma: no cover
+    psutil = None
+
+
+# Result of a file: path, imports (None if the file could not be read) and errors
+SpillRecord = Tuple[str, Optional[ImportsCollectionFile], List[ScanError]]
+
+
+def current_rss() -> Optional[int]:
+    """Get the resident memory of the current process in bytes, None if unknown
+
+    Notes:
+        It's read from /proc in linux, in other platforms psutil is required
+    """
+    try:
+        with open("/proc/self/statm", "r", encoding="utf-8") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if psutil is not None:
+        return int(psutil.Process().memory_info().rss)
+    return None
+
+
+class SpillWriter:
+    """
+    Append the results of the files to a gzip file of JSON lines, a line per file
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the writer
+        Args:
+            path: path of the spill file, it's overwritten
+        """
+        self.path = path
+        self.results = 0
+        self._file: IO[str] = gzip.open(path, "wt", encoding="utf-8")
+
+    def __enter__(self) -> "SpillWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def write(self, batch: List[SpillRecord]) -> None:
+        """Append a batch of results"""
+        for path, imports, errors in batch:
+            record = {
+                "path": path,
+                "imports": imports.to_dict() if imports is not None else None,
+                "errors": [error.to_dict() for error in errors],
+            }
+            self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self.results += len(batch)
+
+    def close(self) -> None:
+        """Flush the compressed stream and close the file"""
+        self._file.close()
+
+
+class SpilledImports:
+    """
+    Results of a bounded scan saved in a spill file, they are read lazily on every
+    iteration, one file at a time
+    """
+
+    def __init__(self, path: str, results: int) -> None:
+        """Initialize the spilled results
+        Args:
+            path: path of the spill file written by SpillWriter
+            results: amount of files in the spill file
+        """
+        self.path = path
+        self.results = results
+
+    def _records(self) -> Iterator[SpillRecord]:
+        """Read the results saved, one file at a time"""
+        with gzip.open(self.path, "rt", encoding="utf-8") as file:
+            for line in file:
+                record = json.loads(line)
+                imports = record["imports"]
+                yield (
+                    record["path"],
+                    ImportsCollectionFile.from_dict(imports)
+                    if imports is not None
+                    else None,
+                    [ScanError.from_dict(error) for error in record["errors"]],
+                )
+
+    def __iter__(self) -> Iterator[Tuple[str, ImportsCollectionFile]]:
+        """Get the path and the imports of every file parsed"""
+        for path, imports, _ in self._records():
+            if imports is not None:
+                yield path, imports
+
+    def errors(self) -> Iterator[Tuple[str, List[ScanError]]]:
+        """Get the path and the errors of every file with errors, see errors_resume"""
+        for path, _, errors in self._records():
+            if errors:
+                yield path, errors
+
+    def __len__(self) -> int:
+        return self.results
@@ -0,0 +1,220 @@
+"""Statistics of the imports parsed, updated incrementally"""
+import os
+import threading
+from collections import Counter
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from py_imports.base.models import ImportFromStatement, ImportsCollectionFile
+
+
+class _FileStatistics:
+    """
+    Contribution of a file to the counters, saved to subtract it when the file is
+    re-scanned or removed
+    """
+
+    __slots__ = (
+        "package",
+        "modules",
+        "statements",
+        "relative",
+        "inner_scope",
+        "names",
+        "unused",
+    )
+
+    def __init__(self, path: str, collection: ImportsCollectionFile) -> None:
+        from_statements: List[ImportFromStatement] = [
+            *collection.absolute_imports,
+            *collection.relative_imports,
+        ]
+        statements = [*collection.imports, *from_statements]
+
+        self.package = os.path.dirname(path)
+        self.modules: FrozenSet[str] = frozenset(
+            [
+                *(
+                    child
+                    for statement in collection.imports
+                    for child in statement.children
+                ),
+                *(
+                    "." * statement.level + statement.parent
+                    for statement in from_statements
+                ),
+            ]
+        )
+        self.statements = len(statements)
+        self.relative = len(collection.relative_imports)
+        self.inner_scope = sum(statement.in_inner_scope for statement in statements)
+        self.names = sum(len(statement.children) for statement in statements)
+        self.unused = sum(len(statement.children_unused) for statement in statements)
+
+    def counters(self) -> Dict[str, int]:
+        """Get the totals of the file"""
+        return {
+            "files": 1,
+            "statements": self.statements,
+            "relative": self.relative,
+            "absolute": self.statements - self.relative,
+            "inner_scope": self.inner_scope,
+            "names": self.names,
+            "unused": self.unused,
+        }
+
+
+class ImportStatistics:
+    """
+    Counters of the imports parsed, like fan-in, fan-out, relative vs absolute
+    imports or the density of unused imports by package
+
+    Notes:
+        The contribution of every file is added when the file is parsed and
+        subtracted when it's re-scanned or removed, so the counters are never
+        computed again from every file. The modules are counted as they are imported,
+        the relative imports keep their leading dots, ex. "..utils". The package of a
+        file is the directory that contains it. The updates and the queries are guarded
+        by a lock, so the counters can be queried while the files are registered from
+        other threads
+
+    Cost:
+        add and remove: O(modules imported by the file)
+        fan_in, fan_out, total, relative_ratio and unused_density: O(1)
+        most_imported and highest_fan_out: O(n log top), n is the amount of modules
+            or files, the rankings are selected with a heap on every query
+        summary: O(n log top + packages), the density of every package is computed
+    """
+
+    TOTALS = (
+        "files",
+        "statements",
+        "relative",
+        "absolute",
+        "inner_scope",
+        "names",
+        "unused",
+    )
+
+    def __init__(self, lock: Optional[threading.RLock] = None) -> None:
+        """Initialize the counters
+        Args:
+            lock: lock shared with the owner of the statistics, ex. PyImports, by
+                default the statistics have their own lock
+        """
+        self._lock = lock or threading.RLock()
+        self._files: Dict[str, _FileStatistics] = {}
+        # Amount of files that import every module
+        self._fan_in: Counter = Counter()
+        # Amount of modules imported by every file
+        self._fan_out: Counter = Counter()
+        self._totals: Counter = Counter()
+        # Names imported, names unused and files by package
+        self._packages: Dict[str, Counter] = {}
+
+    def _update(self, path: str, statistics: _FileStatistics, sign: int) -> None:
+        """Add (sign 1) or subtract (sign -1) the contribution of the file"""
+        for module in statistics.modules:
+            self._fan_in[module] += sign
+            if not self._fan_in[module]:
+                del self._fan_in[module]
+
+        for name, value in statistics.counters().items():
+            self._totals[name] += sign * value
+
+        package = self._packages.setdefault(statistics.package, Counter())
+        package["names"] += sign * statistics.names
+        package["unused"] += sign * statistics.unused
+        package["files"] += sign
+        if not package["files"]:
+            del self._packages[statistics.package]
+
+        if sign > 0:
+            self._fan_out[path] = len(statistics.modules)
+        else:
+            del self._fan_out[path]
+
+    def add(self, path: str, collection: ImportsCollectionFile) -> None:
+        """Count the imports of a file, replacing the counts of a previous scan
+        Args:
+            path: path of the file scanned
+            collection: imports found in the file
+        """
+        statistics = _FileStatistics(path, collection)
+        with self._lock:
+            self.remove(path)
+            self._files[path] = statistics
+            self._update(path, statistics, 1)
+
+    def remove(self, path: str) -> None:
+        """Subtract the imports of a file from the counters"""
+        with self._lock:
+            statistics = self._files.pop(path, None)
+            if statistics is not None:
+                self._update(path, statistics, -1)
+
+    def fan_in(self, module: str) -> int:
+        """Get the amount of files that import the module"""
+        with self._lock:
+            return self._fan_in[module]
+
+    def fan_out(self, path: str) -> int:
+        """Get the amount of modules imported by the file"""
+        with self._lock:
+            return self._fan_out[path]
+
+    def most_imported(self, top: int = 10) -> List[Tuple[str, int]]:
+        """Get the modules imported by more files, with the amount of files"""
+        with self._lock:
+            return self._fan_in.most_common(top)
+
+    def highest_fan_out(self, top: int = 10) -> List[Tuple[str, int]]:
+        """Get the files that import more modules, with the amount of modules"""
+        with self._lock:
+            return self._fan_out.most_common(top)
+
+    def total(self, name: str) -> int:
+        """Get a total of every file parsed
+
+        Args:
+            name: one of TOTALS, "names" are the children imported and "unused" the
+                children unused
+        """
+        with self._lock:
+            return self._totals[name]
+
+    @property
+    def relative_ratio(self) -> float:
+        """Proportion of the import statements that are relative"""
+        with self._lock:
+            statements = self._totals["statements"]
+            return self._totals["relative"] / statements if statements else 0.0
+
+    def unused_density(self, package: str) -> float:
+        """Get the proportion of the names imported in the package that are unused"""
+        with self._lock:
+            counters = self._packages.get(package)
+            if not counters or not counters["names"]:
+                return 0.0
+            return counters["unused"] / counters["names"]
+
+    def summary(self, top: int = 10) -> Dict[str, Any]:
+        """Get the counters in a compact JSON serializable representation
+
+        Args:
+            top: amount of modules and files in the rankings
+        """
+        with self._lock:
+            return {
+                **{name: self._totals[name] for name in self.TOTALS},
+                "relative_ratio": round(self.relative_ratio, 4),
+                "most_imported": self.most_imported(top),
+                "highest_fan_out": self.highest_fan_out(top),
+                "unused_density": {
+                    package: round(self.unused_density(package), 4)
+                    for package in sorted(self._packages)
+                },
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._files)
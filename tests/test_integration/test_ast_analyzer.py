@@ -2,8 +2,11 @@
 import ast
 from typing import Callable
 
-from py_imports.ast_analyzers import AstImportAnalyzer
+from pytest_mock import MockerFixture
+
+from py_imports.ast_analyzers import AstImportAnalyzer, TokenImportAnalyzer
 from py_imports.manager import PyImports
+from py_imports.plugins import AnalyzerPlugin
 
 
 class TestAstImportAnalyzer:
@@ -43,3 +46,124 @@ class TestAstImportAnalyzer:
         assert imports.relative_imports[0].statement == content_file
         assert imports.relative_imports[0].children[0] == "request"
         assert imports.relative_imports[0].level == 3
+
+    def test_recover_imports_from_source_with_syntax_errors(self) -> None:
+        """
+        Validate if the token analyzer recover the imports around a syntax error
+
+        Notes:
+            Cases:
+                import os
+                x = (
+                from module1 import (foo,
+                    bar)
+                text = "import fake"
+
+        Expected results:
+            * The imports must be recovered despite the unclosed parenthesis
+            * The import inside the string must be ignored
+        """
+        raw_content = (
+            "import os\nx = (\nfrom module1 import (foo,\n    bar)\n"
+            'text = "import fake"\n'
+        )
+        analyzer = TokenImportAnalyzer(raw_content.splitlines(True), raw_content)
+        analyzer.analyze()
+        imports = analyzer.imports_metadata
+
+        assert imports.imports[0].children == ["os"]
+        assert imports.absolute_imports[0].children == ["foo", "bar"]
+        assert imports.absolute_imports[0].line == 3
+        assert len(imports.imports) == 1
+
+    def test_runtime_relevance_of_the_imports(self) -> None:
+        """
+        Validate if the imports are classified according to when they are executed
+
+        Notes:
+            Cases:
+                import os
+                from typing import TYPE_CHECKING
+                if TYPE_CHECKING:
+                    from flask import request
+                try:
+                    import ujson as json
+                except ImportError:
+                    import json
+                if os.name == "nt":
+                    import winreg
+                def foo():
+                    import django
+
+        Expected results:
+            * os and typing are always imported
+            * flask is imported just by the type checkers
+            * ujson and its fallback json are optional imports
+            * winreg is a conditional import
+            * django is deferred until foo is called
+        """
+        raw_content = (
+            "import os\n"
+            "from typing import TYPE_CHECKING\n"
+            "if TYPE_CHECKING:\n"
+            "    from flask import request\n"
+            "try:\n"
+            "    import ujson as json\n"
+            "except ImportError:\n"
+            "    import json\n"
+            'if os.name == "nt":\n'
+            "    import winreg\n"
+            "def foo():\n"
+            "    import django\n"
+        )
+        analyzer = self.ast_analyzer(raw_content.splitlines(True), raw_content)
+        analyzer.visit(ast.parse(raw_content))
+        imports = analyzer.imports_metadata
+
+        relevance = {
+            statement.statement: statement.runtime_relevance
+            for statement in [*imports.imports, *imports.absolute_imports]
+        }
+        assert relevance == {
+            "import os": "always",
+            "from typing import TYPE_CHECKING": "always",
+            "from flask import request": "type_checking",
+            "import ujson as json": "optional",
+            "import json": "optional",
+            "import winreg": "conditional",
+            "import django": "deferred",
+        }
+
+    def test_source_parsed_once_with_plugins(self, mocker: MockerFixture) -> None:
+        """
+        Validate if the source is parsed just once, for the imports, the unused
+        imports and the custom plugins
+
+        Notes:
+            Cases:
+                import os
+                os.getcwd()
+        """
+
+        class CallsCounter(AnalyzerPlugin):
+            """Count the calls"""
+
+            name = "calls"
+
+            def __init__(self) -> None:
+                self.calls = 0
+
+            def visit_Call(self, _: ast.Call) -> None:  # pylint: disable=C0103
+                """Count the call"""
+                self.calls += 1
+
+            def result(self) -> int:
+                return self.calls
+
+        parse_spy = mocker.spy(ast, "parse")
+        with self.entry_point(plugins=[CallsCounter]) as handler:  # type: ignore
+            imports = handler.get_imports_from_source("import os\nos.getcwd()\n")
+
+        assert parse_spy.call_count == 1
+        assert imports.plugins_data == {"calls": 1}
+        assert imports.imports[0].children_unused == []
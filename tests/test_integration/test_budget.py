@@ -0,0 +1,101 @@
+"""Integration test cases to validate the budgets of the entry points"""
+import os
+from typing import Callable
+
+import pytest
+
+from py_imports.budget import ImportBudget
+from py_imports.exceptions import ImportBudgetExceeded
+from py_imports.manager import PyImports
+
+
+class TestImportBudgetChecker:
+    """
+    Test cases to validate ImportBudgetChecker behavior
+    """
+
+    entry_point = PyImports
+
+    def test_budget_exceeded_with_the_import_chain(
+        self, tmpdir: str, set_up_file: Callable
+    ) -> None:
+        """
+        Validate if the budgets are checked with the modules loaded at import time
+
+        Notes:
+            Cases:
+                cli.py
+                    import reports
+                    def main():
+                        import numpy
+                reports.py
+                    import pandas
+                    import os
+
+        Expected results:
+            * pandas is loaded by cli through reports
+            * numpy is not loaded at import time, it's deferred until main is called
+            * cli loads 3 modules: reports, pandas and os
+        """
+        cli_file = set_up_file(
+            "import reports\ndef main():\n    import numpy\n",
+            os.path.join(tmpdir, "cli.py"),
+        )
+        set_up_file("import pandas\nimport os\n", os.path.join(tmpdir, "reports.py"))
+        budgets = [
+            ImportBudget(cli_file, max_modules=2, forbidden=["pandas", "numpy"]),
+            ImportBudget("reports", max_modules=3, forbidden=["numpy"]),
+        ]
+
+        with self.entry_point() as handler:  # type: ignore
+            handler.get_imports(str(tmpdir))
+
+            with pytest.raises(ImportBudgetExceeded) as error:
+                handler.check_import_budgets(budgets)
+
+            violations = error.value.violations
+            assert [violation.reason for violation in violations] == [
+                "forbidden",
+                "max_modules",
+            ]
+            assert violations[0].chain == ["cli", "reports", "pandas"]
+            assert violations[1].chain == ["cli", "reports"]
+            assert "cli loads 3 modules" in str(error.value)
+
+    def test_budget_with_cycles_and_unknown_entries(
+        self, tmpdir: str, set_up_file: Callable
+    ) -> None:
+        """
+        Validate if the heaviest import is counted like the modules loaded by the
+        entry point, and if an entry point not parsed is reported
+
+        Notes:
+            Cases:
+                cli.py
+                    import reports
+                reports.py
+                    import pandas
+                    import cli
+
+        Expected results:
+            * The entry point reached through the cycle is not counted
+            * A typo in the entry point must not pass the budget silently
+        """
+        set_up_file("import reports\n", os.path.join(tmpdir, "cli.py"))
+        set_up_file("import pandas\nimport cli\n", os.path.join(tmpdir, "reports.py"))
+        budgets = [
+            ImportBudget("cli", max_modules=1),
+            ImportBudget("clii", max_modules=0, forbidden=["pandas"]),
+        ]
+
+        with self.entry_point() as handler:  # type: ignore
+            handler.get_imports(str(tmpdir))
+            violations = handler.check_import_budgets(budgets, raise_error=False)
+
+            assert [violation.reason for violation in violations] == [
+                "max_modules",
+                "unknown_entry",
+            ]
+            assert "cli loads 2 modules" in violations[0].message
+            assert "(2 modules)" in violations[0].message
+            assert violations[1].entry == "clii"
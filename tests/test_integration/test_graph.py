@@ -0,0 +1,100 @@
+"""Integration test cases to validate the graph of dependencies between modules"""
+import os
+from typing import Callable
+
+from py_imports.manager import PyImports
+
+
+class TestImportGraph:
+    """
+    Test cases to validate ImportGraph behavior
+    """
+
+    entry_point = PyImports
+
+    def test_tests_affected_by_a_file_changed(
+        self, tmpdir: str, set_up_file: Callable
+    ) -> None:
+        """
+        Validate if the modules that import the file changed, directly or not, are
+        affected by the change
+
+        Notes:
+            Cases:
+                pkg/__init__.py
+                    **empty**
+                pkg/core.py
+                    import json
+                pkg/api.py
+                    from .core import dumps
+                tests/test_api.py
+                    from pkg.api import handler
+                tests/test_other.py
+                    import json
+
+        Expected results:
+            * pkg.api imports pkg.core with a relative import
+            * test_api imports pkg.core through pkg.api
+            * test_other is not affected
+        """
+        os.makedirs(os.path.join(tmpdir, "pkg"))
+        os.makedirs(os.path.join(tmpdir, "tests"))
+        set_up_file("", os.path.join(tmpdir, "pkg", "__init__.py"))
+        core_file = set_up_file("import json", os.path.join(tmpdir, "pkg", "core.py"))
+        api_file = set_up_file(
+            "from .core import dumps", os.path.join(tmpdir, "pkg", "api.py")
+        )
+        test_file = set_up_file(
+            "from pkg.api import handler", os.path.join(tmpdir, "tests", "test_api.py")
+        )
+        set_up_file("import json", os.path.join(tmpdir, "tests", "test_other.py"))
+
+        with self.entry_point() as handler:  # type: ignore
+            handler.get_imports(str(tmpdir))
+            report = handler.affected_by([core_file])
+
+            assert report.modules == ["pkg.api", "pkg.core", "test_api"]
+            assert report.files == sorted([core_file, api_file, test_file])
+            assert report.test_files == [test_file]
+
+            graph = handler.import_graph()
+            assert "json" in graph.dependencies["pkg.core"]
+            assert "pkg" in graph.dependencies["pkg.api"]
+
+    def test_files_with_the_same_module_name(
+        self, tmpdir: str, set_up_file: Callable
+    ) -> None:
+        """
+        Validate if the files outside of any package with the same name are not
+        merged in the same module
+
+        Notes:
+            Cases:
+                app.py
+                    import json
+                tests/unit/test_api.py
+                    import app
+                tests/integration/test_api.py
+                    import app
+
+        Expected results:
+            * Both test files must be affected by a change in app.py
+        """
+        app_file = set_up_file("import json", os.path.join(tmpdir, "app.py"))
+        test_files = []
+        for suite in ("unit", "integration"):
+            os.makedirs(os.path.join(tmpdir, "tests", suite))
+            test_files.append(
+                set_up_file(
+                    "import app", os.path.join(tmpdir, "tests", suite, "test_api.py")
+                )
+            )
+
+        with self.entry_point() as handler:  # type: ignore
+            handler.get_imports(str(tmpdir))
+            report = handler.affected_by([app_file])
+
+            assert report.test_files == sorted(test_files)
+            graph = handler.import_graph()
+            assert graph.module_key(test_files[0]) != graph.module_key(test_files[1])
+            assert graph.module_key(app_file) == "app"
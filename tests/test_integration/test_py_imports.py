@@ -1,12 +1,18 @@
 """Integration test cases to validate the properly parse of python imports"""
 import ast
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, List, Tuple
 
+import pytest
+
 from py_imports.base.models import ImportStatement
 from py_imports.manager import PyImports
+from py_imports.plugins import DunderAllPlugin
 
 
-class TestPyImports:
+class TestPyImports:  # pylint: disable=R0904
     """
     Test cases to validate the properly parse of imports in .py file
     """
@@ -220,3 +226,477 @@ class TestPyImports:
 
             assert first_absolute_imports.in_inner_scope
             assert isinstance(first_absolute_imports.outer_parent_node, ast.FunctionDef)
+
+    def test_get_imports_from_sources_in_memory(self) -> None:
+        """
+        Validate if the imports are properly parse from sources already loaded in
+        memory, as text or as bytes with an encoding declaration
+
+        Notes:
+            Cases:
+                main.py
+                    import flask
+
+                legacy.py (latin-1)
+                    # -*- coding: latin-1 -*-
+                    from módulo import función
+
+        Expected results:
+            * Both sources must be registered by the name provided
+            * The bytes must be decoded with the encoding declared in the source
+        """
+        sources = [
+            ("main.py", "import flask"),
+            (
+                "legacy.py",
+                "# -*- coding: latin-1 -*-\nfrom módulo import función".encode("latin-1"),
+            ),
+        ]
+
+        with self.entry_point() as handler:  # type: ignore
+            imports = handler.get_imports_from_sources(sources)
+
+            assert imports["main.py"].imports[0].children == ["flask"]
+            assert imports["legacy.py"].absolute_imports[0].parent == "módulo"
+            assert imports["legacy.py"].absolute_imports[0].line == 2
+            assert handler.imports_resume().keys() == {"main.py", "legacy.py"}
+
+    def test_resilient_mode_registers_errors_and_recovers_imports(
+        self, tmpdir: str, set_up_file: Callable
+    ) -> None:
+        """
+        Validate if in resilient mode a file that can not be parsed does not abort
+        the scan of the directory
+
+        Notes:
+            Cases:
+                broken.py
+                    import flask
+                    def foo(:
+                        import django
+
+                valid.py
+                    import requests
+
+        Expected results:
+            * The scan of the directory must finish with both files registered
+            * The syntax error must be registered as a recovered error
+            * The imports in the broken file must be recovered by the tokenizer
+        """
+        broken_file = set_up_file(
+            "import flask\ndef foo(:\n    import django\n",
+            os.path.join(tmpdir, "broken.py"),
+        )
+        valid_file = set_up_file("import requests", os.path.join(tmpdir, "valid.py"))
+
+        with self.entry_point(resilient=True) as handler:  # type: ignore
+            imports = handler.get_imports(str(tmpdir))
+            errors = handler.errors_resume()
+
+            assert imports[valid_file].imports[0].children == ["requests"]
+            assert [error.error_type for error in errors[broken_file]] == ["SyntaxError"]
+            assert errors[broken_file][0].recovered
+
+            recovered = imports[broken_file].imports
+            assert [statement.children for statement in recovered] == [
+                ["flask"],
+                ["django"],
+            ]
+            assert recovered[1].in_inner_scope
+
+    def test_resilient_rescan_replaces_the_errors(
+        self, tmpdir: str, set_up_file: Callable
+    ) -> None:
+        """
+        Validate if the errors of a file are replaced when it's scanned again
+
+        Expected results:
+            * A file scanned twice while broken must have the error once
+            * A file fixed must not have errors after the re-scan
+        """
+        broken_file = set_up_file("def foo(:\n", os.path.join(tmpdir, "broken.py"))
+
+        with self.entry_point(resilient=True) as handler:  # type: ignore
+            handler.get_imports(broken_file)
+            handler.get_imports(broken_file)
+            handler.get_imports_from_source("def bar(:\n", name="buffer.py")
+            handler.get_imports_from_source("def bar(:\n", name="buffer.py")
+
+            errors = handler.errors_resume()
+            assert len(errors[broken_file]) == 1
+            assert len(errors["buffer.py"]) == 1
+
+            set_up_file("import os\n", broken_file)
+            handler.get_imports(broken_file)
+            handler.get_imports_from_source("import os\n", name="buffer.py")
+
+            assert not handler.errors_resume()
+
+    def test_resilient_mode_with_an_unknown_encoding(
+        self, tmpdir: str, set_up_file: Callable
+    ) -> None:
+        """
+        Validate if a file with an unknown encoding declared registers the error once
+
+        Expected results:
+            * The source decoded as utf-8 must be parsed without the declaration
+        """
+        path = set_up_file(
+            "# -*- coding: nope -*-\nimport os\n", os.path.join(tmpdir, "legacy.py")
+        )
+
+        with self.entry_point(resilient=True) as handler:  # type: ignore
+            imports = handler.get_imports(path)
+            errors = handler.errors_resume()[path]
+
+            assert len(errors) == 1
+            assert errors[0].message == "unknown encoding: nope"
+            assert imports.imports[0].children == ["os"]
+            assert imports.imports[0].line == 2
+
+    def test_files_importing_a_name_in_a_local_directory(
+        self, py_package: Tuple[str, List[str]]
+    ) -> None:
+        """
+        Validate if the reverse index is built while the directory is parsed
+
+        Expected results:
+            * django is imported in module1.py and as an object of module1 in main.py
+        """
+        dir_path, [_, second_file, third_file] = py_package
+
+        with self.entry_point() as handler:  # type: ignore
+            handler.get_imports(dir_path)
+
+            assert handler.files_importing("django") == [second_file]
+            assert handler.files_importing("module1.*") == [third_file]
+            assert handler.index.lookup("flask") == [(third_file, 1)]
+
+    def test_sharded_scan_merged_from_artifacts(
+        self, tmpdir: str, py_package: Tuple[str, List[str]]
+    ) -> None:
+        """
+        Validate if the artifacts of every shard are merged in the same result of a
+        scan without shards
+
+        Expected results:
+            * Every file must be parsed in one shard and just one
+            * The imports merged must be the same of the scan without shards
+            * The reverse index must be built with the imports merged
+        """
+        dir_path, file_paths = py_package
+        num_shards = 2
+        artifact_paths = []
+        for shard in range(num_shards):
+            artifact_path = os.path.join(tmpdir, f"shard-{shard}.json")
+            with self.entry_point() as handler:  # type: ignore
+                handler.get_imports(dir_path, shard=shard, num_shards=num_shards)
+                handler.dump(artifact_path, shard=shard)
+            artifact_paths.append(artifact_path)
+
+        with self.entry_point() as handler:  # type: ignore
+            handler.get_imports(dir_path)
+            expected = {
+                path: imports.to_dict()
+                for path, imports in handler.imports_resume().items()
+            }
+
+        with self.entry_point() as handler:  # type: ignore
+            merged = handler.load(*artifact_paths)
+
+            assert sorted(merged) == sorted(file_paths)
+            assert {
+                path: imports.to_dict() for path, imports in merged.items()
+            } == expected
+            assert handler.files_importing("flask") == [file_paths[2]]
+
+    @pytest.mark.skipif(sys.version_info < (3, 8), reason="The fixer requires 3.8+")
+    def test_fix_unused_imports_in_a_local_directory(
+        self, py_package: Tuple[str, List[str]]
+    ) -> None:
+        """
+        Validate if the unused imports are removed from the files in the directory
+
+        Notes:
+            Test case:
+                __init__.py
+                    **empty**
+                module1.py
+                    import django
+                main.py
+                    import flask
+                    from module1 import django
+
+        Expected results:
+            * In dry run mode the files must not be modified
+            * Every file with unused imports must be fixed, just them
+        """
+        dir_path, [_, second_file, third_file] = py_package
+
+        with self.entry_point() as handler:  # type: ignore
+            results = handler.fix_unused_imports(dir_path, dry_run=True, workers=2)
+
+            assert sorted(result.path for result in results) == [third_file, second_file]
+            diffs = {result.path: result.diff for result in results}
+            assert "-import flask\n" in diffs[third_file]
+            with open(third_file, "r", encoding="utf-8") as file:
+                assert file.read() == "import flask\nfrom module1 import django"
+
+            handler.fix_unused_imports(dir_path, workers=2)
+            with open(second_file, "r", encoding="utf-8") as file:
+                assert file.read() == ""
+            assert handler.fix_unused_imports(dir_path) == []
+
+    def test_get_imports_in_a_local_directory_with_threads(
+        self, py_package: Tuple[str, List[str]]
+    ) -> None:
+        """
+        Validate if the parse of a directory in a pool of threads gets the same
+        imports of the parse in the current thread
+        """
+        dir_path, file_paths = py_package
+
+        with self.entry_point() as handler:  # type: ignore
+            expected = {
+                path: imports.to_dict()
+                for path, imports in handler.get_imports(dir_path).items()
+            }
+
+        with self.entry_point() as handler:  # type: ignore
+            imports = handler.get_imports(dir_path, workers=4)
+
+            assert {path: data.to_dict() for path, data in imports.items()} == expected
+            assert sorted(handler.imports_resume()) == sorted(file_paths)
+
+    def test_sources_registered_concurrently(self) -> None:
+        """
+        Validate if the sources parsed concurrently from several threads are all
+        registered in the context and in the reverse index
+        """
+        sources = [(f"module_{index}.py", f"import pkg_{index}") for index in range(200)]
+
+        with self.entry_point() as handler:  # type: ignore
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                for name, source in sources:
+                    executor.submit(handler.get_imports_from_source, source, name)
+
+            assert len(handler.imports_resume()) == len(sources)
+            assert handler.files_importing("pkg_199") == ["module_199.py"]
+
+    def test_index_and_statistics_queried_concurrently(self) -> None:
+        """
+        Validate if the index and the statistics can be queried while the sources
+        are registered from other threads
+
+        Expected results:
+            * The queries must never see the counters or the index mid-update
+        """
+        sources = [
+            (f"pkg_{index % 10}/module_{index}.py", f"import pkg_{index}")
+            for index in range(500)
+        ]
+
+        with self.entry_point() as handler:  # type: ignore
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                registered = [
+                    executor.submit(handler.get_imports_from_source, source, name)
+                    for name, source in sources
+                ]
+                queries = [
+                    executor.submit(
+                        lambda: (handler.statistics.summary(), handler.index.lookup("*"))
+                    )
+                    for _ in range(100)
+                ]
+            for future in registered + queries:
+                future.result()
+
+            assert handler.statistics.total("files") == len(sources)
+            assert len(handler.index.lookup("*")) == len(sources)
+
+    @staticmethod
+    def set_up_environment(tmpdir: str, set_up_file: Callable) -> str:
+        """
+        Create a site-packages directory with two distributions installed, alpha
+        imports beta
+        """
+        site_packages = os.path.join(tmpdir, "site-packages")
+        for name, module, content in (
+            ("alpha", "alpha.py", "import os\nimport beta\n"),
+            ("beta", "beta.py", "from json import loads\n"),
+        ):
+            dist_info = os.path.join(site_packages, f"{name}-1.0.dist-info")
+            os.makedirs(dist_info)
+            set_up_file(
+                f"Metadata-Version: 2.1\nName: {name}\nVersion: 1.0\n",
+                os.path.join(dist_info, "METADATA"),
+            )
+            set_up_file(f"{module},,\n", os.path.join(dist_info, "RECORD"))
+            set_up_file(content, os.path.join(site_packages, module))
+        return site_packages
+
+    def test_environment_scan_cached_by_distribution(
+        self, tmpdir: str, set_up_file: Callable, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Validate if the imports of the distributions installed are cached, and just
+        the distributions upgraded are parsed again
+
+        Expected results:
+            * The first scan must parse the files in the RECORD of every distribution
+            * The second scan must load every distribution from the cache
+            * The upgrade of a distribution must replace its cache
+        """
+        site_packages = self.set_up_environment(tmpdir, set_up_file)
+        cache_dir = os.path.join(tmpdir, "cache")
+
+        parsed: List[str] = []
+        process_file = self.entry_point._process_file  # pylint: disable=W0212
+
+        def spy(handler: PyImports, path: str) -> object:
+            parsed.append(os.path.basename(path))
+            return process_file(handler, path)
+
+        monkeypatch.setattr(self.entry_point, "_process_file", spy)
+        with self.entry_point() as handler:  # type: ignore
+            imports = handler.get_environment_imports(cache_dir, [site_packages])
+            assert sorted(parsed) == ["alpha.py", "beta.py"]
+            assert handler.files_importing("beta") == [
+                os.path.join(site_packages, "alpha.py")
+            ]
+
+        parsed.clear()
+        with self.entry_point() as handler:  # type: ignore
+            cached = handler.get_environment_imports(cache_dir, [site_packages])
+            assert not parsed
+            assert {path: data.to_dict() for path, data in cached.items()} == {
+                path: data.to_dict() for path, data in imports.items()
+            }
+
+        set_up_file(
+            "Metadata-Version: 2.1\nName: beta\nVersion: 2.0\n",
+            os.path.join(site_packages, "beta-1.0.dist-info", "METADATA"),
+        )
+        with self.entry_point() as handler:  # type: ignore
+            handler.get_environment_imports(cache_dir, [site_packages])
+            assert parsed == ["beta.py"]
+        assert sorted(
+            (name.split("__")[0], name.split("__")[2]) for name in os.listdir(cache_dir)
+        ) == [("alpha", "1.0"), ("beta", "2.0")]
+
+    def test_environment_cache_shared_by_several_environments(
+        self, tmpdir: str, set_up_file: Callable
+    ) -> None:
+        """
+        Validate if several environments and plugins can share the cache directory
+
+        Expected results:
+            * The imports of every environment must have the paths of its files
+            * The cache of the other environments and plugins must not be pruned
+        """
+        environments = [
+            self.set_up_environment(os.path.join(tmpdir, name), set_up_file)
+            for name in ("venv1", "venv2")
+        ]
+        cache_dir = os.path.join(tmpdir, "cache")
+
+        for site_packages in environments:
+            with self.entry_point() as handler:  # type: ignore
+                imports = handler.get_environment_imports(cache_dir, [site_packages])
+                assert sorted(imports) == [
+                    os.path.join(site_packages, "alpha.py"),
+                    os.path.join(site_packages, "beta.py"),
+                ]
+        with self.entry_point(plugins=[DunderAllPlugin]) as handler:  # type: ignore
+            handler.get_environment_imports(cache_dir, environments[:1])
+
+        # alpha and beta of every environment, and of the first one with the plugin
+        assert len(os.listdir(cache_dir)) == 6
+
+    def test_statistics_of_a_local_directory(
+        self, py_package: Tuple[str, List[str]]
+    ) -> None:
+        """
+        Validate if the statistics updated incrementally are the same of the
+        statistics of the files parsed once
+
+        Expected results:
+            * A file re-scanned must not be counted twice
+            * A file removed from the context must be removed from the statistics
+        """
+        dir_path, file_paths = py_package
+
+        with self.entry_point() as handler:  # type: ignore
+            for path in file_paths[:1] + file_paths[2:]:
+                handler.get_imports(path)
+            expected = handler.statistics.summary()
+
+        with self.entry_point() as handler:  # type: ignore
+            handler.get_imports(dir_path)
+            handler.get_imports(file_paths[0])
+            handler.remove_imports(file_paths[1])
+
+            assert file_paths[1] not in handler.imports_resume()
+            assert handler.statistics.total("files") == len(file_paths) - 1
+            assert handler.statistics.summary() == expected
+
+    def test_bounded_scan_of_a_local_directory(
+        self, tmpdir: str, py_package: Tuple[str, List[str]]
+    ) -> None:
+        """
+        Validate if the bounded scan spills the same imports of a regular scan
+
+        Expected results:
+            * The results must not be kept in the context
+            * The index and the statistics must be updated just when it's enabled
+        """
+        dir_path, file_paths = py_package
+        spill_path = os.path.join(tmpdir, "results.jsonl.gz")
+
+        with self.entry_point() as handler:  # type: ignore
+            expected = {
+                path: imports.to_dict()
+                for path, imports in handler.get_imports(dir_path).items()
+            }
+
+        with self.entry_point() as handler:  # type: ignore
+            spilled = handler.get_imports_bounded(
+                dir_path, spill_path, max_results=1, workers=2
+            )
+
+            assert len(spilled) == len(file_paths)
+            assert {path: data.to_dict() for path, data in spilled} == expected
+            assert not handler.imports_resume()
+            assert not handler.index
+            assert not handler.statistics
+
+        with self.entry_point() as handler:  # type: ignore
+            handler.get_imports_bounded(dir_path, spill_path, update_index=True)
+
+            assert not handler.imports_resume()
+            assert handler.files_importing("flask") == [file_paths[2]]
+            assert handler.statistics.total("files") == len(file_paths)
+
+    def test_bounded_scan_applies_backpressure(self) -> None:
+        """
+        Validate if the files are parsed at the pace of the consumer of the results
+
+        Expected results:
+            * At most 2 * workers files must be parsed before the first result is
+              consumed
+        """
+        scanned: List[str] = []
+
+        class Handler(self.entry_point):  # type: ignore
+            """Count the files parsed"""
+
+            def _scan_file(self, path: str) -> None:
+                scanned.append(path)
+
+        handler = Handler()
+        # pylint: disable=protected-access
+        results = handler._scan_files_lazily((f"{i}.py" for i in range(100)), 2)
+
+        next(results)
+        assert len(scanned) <= 4
+        assert len(list(results)) == 99
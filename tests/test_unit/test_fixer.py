@@ -0,0 +1,139 @@
+"""Unit test cases to validate the removal of unused imports"""
+import sys
+
+import pytest
+
+from py_imports import fixer
+from py_imports.exceptions import UnsupportedPythonVersion
+from py_imports.fixer import UnusedImportFixer
+
+
+# Disable because pylint assume that the classes used to group test
+# are concrete implementations
+# pylint: disable=no-self-use
+
+requires_end_positions = pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="The fixer requires python 3.8+"
+)
+
+
+class TestUnusedImportFixer:
+    """
+    Test cases to validate UnusedImportFixer
+    """
+
+    @requires_end_positions
+    def test_remove_unused_children_and_statements(self) -> None:
+        """
+        Validate if the unused children are removed from the statements and the
+        statements without children used are removed
+
+        Notes:
+            Cases:
+                import os, sys
+                import numpy as np
+                from module1 import (
+                    foo,
+                    bar as baz,
+                )
+                if sys:
+                    import json
+                foo()
+
+        Expected results:
+            * os is removed from the first statement
+            * The statement of numpy is removed
+            * The parenthesized import keeps just foo
+            * The block of the condition is not left empty
+        """
+        raw_content = (
+            "import os, sys\n"
+            "import numpy as np\n"
+            "from module1 import (\n"
+            "    foo,\n"
+            "    bar as baz,\n"
+            ")\n"
+            "if sys:\n"
+            "    import json\n"
+            "foo()\n"
+        )
+
+        fixed_content, removed = UnusedImportFixer(raw_content).fix()
+
+        assert fixed_content == (
+            "import sys\n"
+            "from module1 import (\n"
+            "    foo,\n"
+            ")\n"
+            "if sys:\n"
+            "    pass\n"
+            "foo()\n"
+        )
+        assert removed == ["os", "numpy as np", "module1.bar as baz", "json"]
+
+    @requires_end_positions
+    def test_source_without_unused_imports_is_not_changed(self) -> None:
+        """
+        Validate if the source code is the same when every import is used
+        """
+        raw_content = "from __future__ import annotations\r\nimport os\r\nos.getcwd()\r\n"
+
+        assert UnusedImportFixer(raw_content).fix() == (raw_content, [])
+
+    @requires_end_positions
+    def test_star_imports_are_kept(self) -> None:
+        """
+        Validate if the star imports are never removed, pyflakes reports them as
+        unused when no undefined name is used in the module
+
+        Notes:
+            Cases:
+                from .base import *
+                import os
+                DEBUG = True
+        """
+        raw_content = "from .base import *\nimport os\nDEBUG = True\n"
+
+        assert UnusedImportFixer(raw_content).fix() == (
+            "from .base import *\nDEBUG = True\n",
+            ["os"],
+        )
+
+    @requires_end_positions
+    def test_imports_with_noqa_are_kept(self) -> None:
+        """
+        Validate if the statements with a noqa comment that ignores F401 are never
+        removed, ex. the imports re-exported
+
+        Notes:
+            Cases:
+                import os, sys  # noqa
+                import json  # noqa: F401
+                from typing import (  # NOQA:E501,F401
+                    Any,
+                )
+                import re  # noqa: E501
+        """
+        raw_content = (
+            "import os, sys  # noqa\nimport json  # noqa: F401\n"
+            "from typing import (  # NOQA:E501,F401\n    Any,\n)\n"
+            "import re  # noqa: E501\n"
+        )
+
+        assert UnusedImportFixer(raw_content).fix() == (
+            "import os, sys  # noqa\nimport json  # noqa: F401\n"
+            "from typing import (  # NOQA:E501,F401\n    Any,\n)\n",
+            ["re"],
+        )
+
+    def test_unsupported_python_version(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Validate if the fixer fails with a clear error in python 3.7, without the
+        end positions of the ast nodes
+        """
+        monkeypatch.setattr(fixer, "END_POSITIONS", False)
+
+        with pytest.raises(UnsupportedPythonVersion):
+            UnusedImportFixer("import os\n")
+        with pytest.raises(UnsupportedPythonVersion):
+            fixer.fix_files(["main.py"])
@@ -0,0 +1,81 @@
+"""Unit test cases to validate the reverse index of imports"""
+
+from py_imports.base.models import ImportsCollectionFile
+from py_imports.index import ImportsIndex
+
+
+# Disable because pylint assume that the classes used to group test
+# are concrete implementations
+# pylint: disable=no-self-use
+
+
+class TestImportsIndex:
+    """
+    Test cases to validate ImportsIndex
+    """
+
+    @staticmethod
+    def collection(*statements: str) -> ImportsCollectionFile:
+        """Build a collection registering a from statement per 'parent:child' pair"""
+        collection = ImportsCollectionFile()
+        for line, statement in enumerate(statements, start=1):
+            parent, child = statement.split(":")
+            level = len(parent) - len(parent.lstrip("."))
+            collection.register_import_from(
+                line=line,
+                children=[child],
+                statement=statement,
+                level=level,
+                parent=parent.lstrip("."),
+            )
+        return collection
+
+    def test_lookup_modules_objects_and_prefixes(self) -> None:
+        """
+        Validate if the names imported are found by exact name and by prefix
+
+        Notes:
+            Cases:
+                main.py
+                    from requests import Session
+                    from django.db.models import Model
+                views.py
+                    from django.http import request
+                    from ..utils import foo
+
+        Expected results:
+            * The object imported must be found with the module as prefix
+            * The prefix query must find every name below the prefix
+            * The relative imports must be found with the leading dots
+        """
+        index = ImportsIndex()
+        index.add(
+            "main.py", self.collection("requests:Session", "django.db.models:Model")
+        )
+        index.add("views.py", self.collection("django.http:request", "..utils:foo"))
+
+        assert index.lookup("requests.Session") == [("main.py", 1)]
+        assert index.lookup("django.db.*") == [("main.py", 2)]
+        assert index.files_importing("django.*") == ["main.py", "views.py"]
+        assert index.lookup("..utils.foo") == [("views.py", 2)]
+        assert index.lookup("flask") == []
+
+    def test_rescan_replaces_the_previous_entries(self) -> None:
+        """
+        Validate if the index is updated when a file is scanned again
+
+        Expected results:
+            * The names that are not imported anymore must not be found
+            * The names removed must not be left as empty prefixes
+        """
+        index = ImportsIndex()
+        index.add("main.py", self.collection("requests:Session"))
+        index.add("main.py", self.collection("flask:request"))
+
+        assert index.lookup("requests.Session") == []
+        assert index.lookup("flask.request") == [("main.py", 1)]
+        assert index.lookup("*") == [("main.py", 1)]
+
+        index.remove("main.py")
+        assert "main.py" not in index
+        assert index.lookup("*") == []
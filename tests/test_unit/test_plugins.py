@@ -0,0 +1,57 @@
+"""Unit test cases to validate the analyzer plugins"""
+import ast
+
+from py_imports.ast_analyzers import AstImportAnalyzer
+from py_imports.plugins import DunderAllPlugin, DynamicImportsPlugin, SysPathPlugin
+
+
+# Disable because pylint assume that the classes used to group test
+# are concrete implementations
+# pylint: disable=no-self-use
+
+
+class TestAnalyzerPlugins:
+    """
+    Test cases to validate the plugins provided
+    """
+
+    def test_plugins_results_attached_to_the_imports(self) -> None:
+        """
+        Validate if the plugins run in the traversal of the analyzer
+
+        Notes:
+            Cases:
+                import importlib, sys
+                __all__ = ["foo"]
+                __all__ += ["bar"]
+                sys.path.insert(0, "lib")
+                importlib.import_module("pkg.module")
+                def foo(name):
+                    __all__ = ["ignored"]
+                    return __import__(name)
+
+        Expected results:
+            * The __all__ in the function is not the one of the module
+            * The module imported with a variable is unknown
+        """
+        raw_content = (
+            "import importlib, sys\n"
+            '__all__ = ["foo"]\n'
+            '__all__ += ["bar"]\n'
+            'sys.path.insert(0, "lib")\n'
+            'importlib.import_module("pkg.module")\n'
+            "def foo(name):\n"
+            '    __all__ = ["ignored"]\n'
+            "    return __import__(name)\n"
+        )
+        plugins = [DynamicImportsPlugin(), DunderAllPlugin(), SysPathPlugin()]
+        analyzer = AstImportAnalyzer(raw_content.splitlines(True), raw_content, plugins)
+        analyzer.visit(ast.parse(raw_content))
+
+        plugins_data = analyzer.imports_metadata.plugins_data
+        assert plugins_data["dunder_all"] == ["foo", "bar"]
+        assert plugins_data["sys_path"] == [{"line": 4, "operation": "insert"}]
+        assert plugins_data["dynamic_imports"] == [
+            {"line": 5, "function": "importlib.import_module", "module": "pkg.module"},
+            {"line": 8, "function": "__import__", "module": None},
+        ]
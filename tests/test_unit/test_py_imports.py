@@ -1,12 +1,12 @@
 """Unit test cases to validate PyImports"""
 import os
-from typing import Callable
+from typing import Callable, Optional
 from unittest.mock import call
 
 import pytest
 from pytest_mock import MockerFixture
 
-from py_imports.exceptions import WrongFileExtension
+from py_imports.exceptions import WrongFileExtension, WrongShardConfiguration
 from py_imports.manager import PyImports
 
 
@@ -58,3 +58,50 @@ class TestPyImports:
             expected_calls = [call(os.path.join(tmpdir, file)) for file in test_py_files]
             assert process_file_mock.call_count == 2
             process_file_mock.assert_has_calls(expected_calls, any_order=True)
+
+    def test_raise_error_when_the_shard_is_out_of_range(self, tmpdir: str) -> None:
+        """
+        Validate if WrongShardConfiguration is raised when the shard is not lower than
+        the total of shards
+        """
+        with self.entry_point() as dep:  # type: ignore
+            with pytest.raises(WrongShardConfiguration):
+                dep.get_imports(tmpdir, shard=2, num_shards=2)
+
+    @pytest.mark.parametrize(
+        "shard, num_shards", [(None, 3), (0, 0), (None, -1)], ids=["missing", "0", "-1"]
+    )
+    def test_raise_error_when_the_shards_are_not_valid(
+        self, tmpdir: str, shard: Optional[int], num_shards: int
+    ) -> None:
+        """
+        Validate if WrongShardConfiguration is raised when the total of shards is
+        lower than 1 or the shard is missing in a directory split in several shards
+        """
+        with self.entry_point() as dep:  # type: ignore
+            with pytest.raises(WrongShardConfiguration):
+                dep.get_imports(tmpdir, shard=shard, num_shards=num_shards)
+
+    def test_raise_error_when_a_shard_is_requested_for_a_file(
+        self, tmpdir: str, set_up_file: Callable
+    ) -> None:
+        """
+        Validate if WrongShardConfiguration is raised when a shard is requested for a
+        file, just the directories are split in shards
+        """
+        path = set_up_file("import os\n", os.path.join(tmpdir, "module.py"))
+
+        with self.entry_point() as dep:  # type: ignore
+            with pytest.raises(WrongShardConfiguration):
+                dep.get_imports(path, shard=0, num_shards=2)
+
+    def test_files_are_assigned_to_the_same_shard_every_time(self) -> None:
+        """
+        Validate if the shard assigned to a path is stable and independent of the
+        way the path is written
+        """
+        shard = self.entry_point.shard_of("pkg/module.py", 8)
+
+        assert 0 <= shard < 8
+        assert self.entry_point.shard_of("./pkg/module.py", 8) == shard
+        assert self.entry_point.shard_of("pkg/module.py", 8) == shard
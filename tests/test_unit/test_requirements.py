@@ -0,0 +1,251 @@
+"""Unit test cases to validate the audit of requirements"""
+import os
+from typing import Callable
+
+import pytest
+
+from py_imports import requirements
+from py_imports.exceptions import UnsupportedPythonVersion
+from py_imports.manager import PyImports
+from py_imports.requirements import (
+    RequirementsAudit,
+    canonical_name,
+    packages_distributions,
+    parse_pyproject,
+    parse_requirements_txt,
+)
+
+
+# Disable because pylint assume that the classes used to group test
+# are concrete implementations
+# pylint: disable=no-self-use
+
+
+class TestRequirementsAudit:
+    """
+    Test cases to validate RequirementsAudit
+    """
+
+    @staticmethod
+    def set_up_environment(tmpdir: str, set_up_file: Callable) -> str:
+        """
+        Create a site-packages directory with two distributions installed
+
+        Notes:
+            * requests declares its top level modules in top_level.txt
+            * PyYAML just has the files installed in the RECORD
+        """
+        site_packages = os.path.join(tmpdir, "site-packages")
+        requests_info = os.path.join(site_packages, "requests-2.0.dist-info")
+        yaml_info = os.path.join(site_packages, "PyYAML-6.0.dist-info")
+        os.makedirs(requests_info)
+        os.makedirs(yaml_info)
+
+        set_up_file(
+            "Metadata-Version: 2.1\nName: requests\nVersion: 2.0\n",
+            os.path.join(requests_info, "METADATA"),
+        )
+        set_up_file("requests\n", os.path.join(requests_info, "top_level.txt"))
+        set_up_file(
+            "Metadata-Version: 2.1\nName: PyYAML\nVersion: 6.0\n",
+            os.path.join(yaml_info, "METADATA"),
+        )
+        set_up_file(
+            "yaml/__init__.py,,\nPyYAML-6.0.dist-info/METADATA,,\n",
+            os.path.join(yaml_info, "RECORD"),
+        )
+        # The backport of importlib.metadata skips the files of the RECORD missing
+        os.makedirs(os.path.join(site_packages, "yaml"))
+        set_up_file("", os.path.join(site_packages, "yaml", "__init__.py"))
+        return site_packages
+
+    def test_packages_mapped_to_distributions(
+        self, tmpdir: str, set_up_file: Callable
+    ) -> None:
+        """
+        Validate if the top level modules are mapped to the distributions installed
+
+        Expected results:
+            * The names of the distributions must be normalized
+        """
+        site_packages = self.set_up_environment(tmpdir, set_up_file)
+
+        assert packages_distributions([site_packages]) == {
+            "requests": ("requests",),
+            "yaml": ("pyyaml",),
+        }
+        assert canonical_name("Flask_SQLAlchemy") == "flask-sqlalchemy"
+
+    def test_raise_error_when_the_metadata_is_not_available(
+        self, tmpdir: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Validate if UnsupportedPythonVersion is raised when importlib.metadata is not
+        available, instead of mapping the modules to any distribution
+        """
+        monkeypatch.setattr(requirements, "importlib_metadata", None)
+
+        with pytest.raises(UnsupportedPythonVersion):
+            packages_distributions([str(tmpdir)])
+
+    def test_parse_requirements_txt(self, tmpdir: str, set_up_file: Callable) -> None:
+        """
+        Validate if the distributions declared in a requirements file are parsed
+
+        Notes:
+            Cases:
+                -r base.txt
+                PyYAML>=6.0  # comment
+                --index-url https://example.org
+                flask[async]==2.0; python_version >= "3.8"
+        """
+        set_up_file("requests\n", os.path.join(tmpdir, "base.txt"))
+        path = set_up_file(
+            "-r base.txt\nPyYAML>=6.0  # comment\n--index-url https://example.org\n"
+            'flask[async]==2.0; python_version >= "3.8"\n',
+            os.path.join(tmpdir, "requirements.txt"),
+        )
+
+        assert parse_requirements_txt(path) == {"requests", "pyyaml", "flask"}
+
+    def test_parse_pyproject(self, tmpdir: str, set_up_file: Callable) -> None:
+        """
+        Validate if the distributions declared in a pyproject.toml are parsed
+
+        Notes:
+            Cases:
+                [project] dependencies and optional-dependencies
+                [tool.poetry] dependencies, dev-dependencies and groups
+                [dependency-groups]
+
+        Expected results:
+            * By default just the runtime requirements must be parsed, the extras
+              included
+            * The development requirements must be parsed when they are included
+        """
+        path = set_up_file(
+            "[project]\n"
+            'dependencies = ["requests>=2.0", "PyYAML"]\n'
+            "[project.optional-dependencies]\n"
+            'async = ["aiohttp"]\n'
+            "[dependency-groups]\n"
+            'test = ["pytest", {include-group = "lint"}]\n'
+            'lint = ["flake8"]\n'
+            "[tool.poetry.dependencies]\n"
+            'python = "^3.7"\n'
+            'Flask_SQLAlchemy = "^2.5"\n'
+            "[tool.poetry.dev-dependencies]\n"
+            'black = "22.3.0"\n'
+            "[tool.poetry.group.docs.dependencies]\n"
+            'mkdocs = "*"\n',
+            os.path.join(tmpdir, "pyproject.toml"),
+        )
+        runtime = {"requests", "pyyaml", "aiohttp", "flask-sqlalchemy"}
+
+        assert parse_pyproject(path) == runtime
+        assert parse_pyproject(path, include_dev=True) == runtime | {
+            "pytest",
+            "flake8",
+            "black",
+            "mkdocs",
+        }
+
+    def test_audit_of_the_imports_against_the_requirements(
+        self, tmpdir: str, set_up_file: Callable
+    ) -> None:
+        """
+        Validate if the distributions imported are classified against the
+        requirements declared
+
+        Notes:
+            Cases:
+                import requests
+                import os
+                import mylocal
+                import unknown_pkg
+                def foo():
+                    import yaml.loader
+
+            Declared:
+                PyYAML, flask
+
+        Expected results:
+            * requests is imported but not declared
+            * flask is declared but not imported
+            * yaml is imported just in an inner scope
+            * mylocal is a first party module, it's ignored
+        """
+        site_packages = self.set_up_environment(tmpdir, set_up_file)
+        with PyImports() as manager:
+            manager.get_imports_from_source(
+                "import requests\nimport os\nimport mylocal\nimport unknown_pkg\n"
+                "def foo():\n    import yaml.loader\n",
+                name="main.py",
+            )
+            imports = manager.imports_resume()
+
+        audit = RequirementsAudit(imports, first_party={"mylocal"}, path=[site_packages])
+        report = audit.audit(["PyYAML", "flask"])
+
+        assert report.distributions == {"requests": {"requests"}, "pyyaml": {"yaml"}}
+        assert report.stdlib == ["os"]
+        assert report.unresolved == ["unknown_pkg"]
+        assert report.undeclared == ["requests"]
+        assert report.unused == ["flask"]
+        assert report.inner_scope_only == ["pyyaml"]
+
+    def test_audit_of_a_namespace_package(
+        self, tmpdir: str, set_up_file: Callable
+    ) -> None:
+        """
+        Validate if the modules of a namespace package shared by several distributions
+        are mapped to the distribution that installs them
+
+        Notes:
+            Cases:
+                from google.protobuf import message
+
+            Installed:
+                protobuf (google/protobuf), google-auth (google/auth) and
+                google-cloud-storage (google/cloud/storage)
+
+            Declared:
+                protobuf, google-cloud-storage
+
+        Expected results:
+            * just protobuf is imported, google-auth is not undeclared
+            * google-cloud-storage is declared but not imported
+        """
+        site_packages = os.path.join(tmpdir, "site-packages")
+        installed = {
+            "protobuf": "google/protobuf/__init__.py,,\ngoogle/protobuf/message.py,,\n",
+            "google_auth": "google/auth/__init__.py,,\n",
+            "google_cloud_storage": "google/cloud/storage/__init__.py,,\n",
+        }
+        for name, record in installed.items():
+            info = os.path.join(site_packages, f"{name}-1.0.dist-info")
+            os.makedirs(info)
+            set_up_file(
+                f"Metadata-Version: 2.1\nName: {name}\nVersion: 1.0\n",
+                os.path.join(info, "METADATA"),
+            )
+            set_up_file("google\n", os.path.join(info, "top_level.txt"))
+            set_up_file(record, os.path.join(info, "RECORD"))
+            for line in record.splitlines():
+                file_path = os.path.join(site_packages, line.split(",")[0])
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                set_up_file("", file_path)
+
+        with PyImports() as manager:
+            manager.get_imports_from_source(
+                "from google.protobuf import message\n", name="main.py"
+            )
+            imports = manager.imports_resume()
+
+        report = RequirementsAudit(imports, path=[site_packages]).audit(
+            ["protobuf", "google-cloud-storage"]
+        )
+
+        assert report.distributions == {"protobuf": {"google"}}
+        assert report.undeclared == []
+        assert report.unused == ["google-cloud-storage"]
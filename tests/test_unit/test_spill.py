@@ -0,0 +1,56 @@
+"""Unit test cases to validate the spill of the results to disk"""
+import os
+
+from py_imports.base.models import ScanError
+from py_imports.manager import PyImports
+from py_imports.spill import SpilledImports, SpillWriter, current_rss
+
+
+# Disable because pylint assume that the classes used to group test
+# are concrete implementations
+# pylint: disable=no-self-use
+
+
+class TestSpill:
+    """
+    Test cases to validate SpillWriter and SpilledImports
+    """
+
+    def test_results_spilled_in_batches_read_lazily(self, tmpdir: str) -> None:
+        """
+        Validate if the results appended in several batches are read back
+
+        Notes:
+            Cases:
+                main.py: import os
+                broken.py: could not be read
+
+        Expected results:
+            * The imports must be the same after the round trip
+            * The files that could not be read must be just in the errors
+        """
+        spill_path = os.path.join(tmpdir, "results.jsonl.gz")
+        imports = PyImports.get_ast_imports_from_source("import os\n")
+        error = ScanError("broken.py", "PermissionError", "denied")
+
+        with SpillWriter(spill_path) as writer:
+            writer.write([("main.py", imports, [])])
+            writer.write([("broken.py", None, [error])])
+
+        spilled = SpilledImports(spill_path, writer.results)
+        assert len(spilled) == 2
+        assert [(path, data.to_dict()) for path, data in spilled] == [
+            ("main.py", imports.to_dict())
+        ]
+        assert [
+            (path, [error.to_dict() for error in errors])
+            for path, errors in spilled.errors()
+        ] == [("broken.py", [error.to_dict()])]
+
+    def test_current_rss(self) -> None:
+        """
+        Validate if the resident memory of the process is measured
+        """
+        rss = current_rss()
+
+        assert rss is None or rss > 0
@@ -0,0 +1,68 @@
+"""Unit test cases to validate the statistics of the imports"""
+
+from py_imports.manager import PyImports
+from py_imports.stats import ImportStatistics
+
+
+# Disable because pylint assume that the classes used to group test
+# are concrete implementations
+# pylint: disable=no-self-use
+
+
+class TestImportStatistics:
+    """
+    Test cases to validate ImportStatistics
+    """
+
+    def test_counters_updated_incrementally(self) -> None:
+        """
+        Validate if the counters are updated when the files are added, re-scanned
+        and removed
+
+        Notes:
+            Cases:
+                pkg/main.py
+                    import os
+                    from .utils import helper
+                    def run():
+                        import json
+                        os.getcwd()
+                pkg/utils.py
+                    import os, sys
+
+        Expected results:
+            * The fan-in must count the files, not the statements
+            * A re-scan must replace the counts of the previous scan
+            * A file removed must be subtracted from every counter
+        """
+        main = PyImports.get_ast_imports_from_source(
+            "import os\nfrom .utils import helper\n\n"
+            "def run():\n    import json\n    os.getcwd()\n"
+        )
+        utils = PyImports.get_ast_imports_from_source("import os, sys\n")
+        statistics = ImportStatistics()
+        statistics.add("pkg/main.py", main)
+        statistics.add("pkg/utils.py", utils)
+
+        assert statistics.fan_in("os") == 2
+        assert statistics.fan_out("pkg/main.py") == 3
+        assert statistics.most_imported(1) == [("os", 2)]
+        assert statistics.total("inner_scope") == 1
+        assert statistics.relative_ratio == 0.25
+        # helper, json, os and sys of utils.py are unused
+        assert statistics.unused_density("pkg") == 4 / 5
+
+        statistics.add("pkg/utils.py", PyImports.get_ast_imports_from_source(""))
+        assert statistics.fan_in("os") == 1
+        assert statistics.total("files") == 2
+
+        statistics.remove("pkg/main.py")
+        statistics.remove("pkg/utils.py")
+        assert len(statistics) == 0
+        assert statistics.summary() == {
+            **{name: 0 for name in ImportStatistics.TOTALS},
+            "relative_ratio": 0.0,
+            "most_imported": [],
+            "highest_fan_out": [],
+            "unused_density": {},
+        }